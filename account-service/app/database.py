@@ -9,6 +9,12 @@ logger = get_logger(__name__)
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Connection pool tuning (overridable via environment for load experiments)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "30"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
 Base = declarative_base()
 
 # Lazy initialization - only create engine if DATABASE_URL is set
@@ -16,7 +22,15 @@ engine = None
 SessionLocal = None
 
 if DATABASE_URL:
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,  # Revalidate connections that went stale while pooled
+        pool_use_lifo=True,  # Reuse hot connections and let overflow drain
+    )
     setup_db_metrics(engine)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -3,26 +3,40 @@ import socket
 import time
 import uuid
 
+import orjson
 import structlog
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
+from sqlalchemy import inspect
 
 from shared.prometheus import register_rabbitmq_metrics
 from shared.prometheus.error_metrics import register_error_metrics
 from shared.logging_config import configure_logging, get_logger
 from app.database import Base, engine
 from app.router import router
+from app import publisher
 
 # Configure structured logging
 configure_logging(service_name="account-service")
 logger = get_logger(__name__)
 
-# Create database tables (only if engine is initialized)
-if engine is not None:
-    Base.metadata.create_all(bind=engine)
-    logger.info("database_tables_initialized")
-
-app = FastAPI(title="Account Service", description="Microservice for managing bank accounts", version="1.0.0")
+# Create database tables (only if engine is initialized and this worker is
+# designated to run schema bootstrap; replicas set RUN_MIGRATIONS=0 so that
+# N workers don't all issue the same DDL round-trips on cold start)
+if engine is not None and os.getenv("RUN_MIGRATIONS", "1") == "1":
+    if not inspect(engine).has_table("accounts"):
+        Base.metadata.create_all(bind=engine)
+        logger.info("database_tables_initialized")
+    else:
+        logger.info("database_tables_already_present")
+
+app = FastAPI(
+    title="Account Service",
+    description="Microservice for managing bank accounts",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Add Prometheus instrumentation
 Instrumentator().instrument(app).expose(app)
@@ -35,71 +49,103 @@ register_rabbitmq_metrics(
 
 
 # Add request logging middleware
+# Paths polled constantly by probes/scrapers; skip logging and ID generation
+UNLOGGED_PATHS = {"/health", "/metrics"}
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all HTTP requests and responses with correlation ID."""
-    # Generate or extract correlation ID
-    correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
-    structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
-
-    logger.info(
-        "request_started",
-        method=request.method,
-        path=request.url.path,
-        query_params=str(request.query_params) if request.query_params else None,
-        client_ip=request.client.host if request.client else None,
-    )
-
-    start_time = time.time()
-    try:
-        response = await call_next(request)
-        process_time = time.time() - start_time
+    if request.url.path in UNLOGGED_PATHS:
+        return await call_next(request)
 
+    # Generate a correlation ID only when the caller didn't send one
+    correlation_id = request.headers.get("X-Correlation-ID") or uuid.uuid4().hex
+
+    # bound_contextvars resets the binding (Token.reset) when the request
+    # ends, so correlation IDs never leak into other tasks on this loop
+    with structlog.contextvars.bound_contextvars(correlation_id=correlation_id):
         logger.info(
-            "request_completed",
+            "request_started",
             method=request.method,
             path=request.url.path,
-            status_code=response.status_code,
-            process_time_ms=round(process_time * 1000, 2),
+            query_params=str(request.query_params) if request.query_params else None,
+            client_ip=request.client.host if request.client else None,
         )
 
-        # Add correlation ID to response headers
-        response.headers["X-Correlation-ID"] = correlation_id
-        return response
-    except Exception as e:
-        process_time = time.time() - start_time
-        logger.error(
-            "request_failed",
-            method=request.method,
-            path=request.url.path,
-            error=str(e),
-            error_type=type(e).__name__,
-            process_time_ms=round(process_time * 1000, 2),
-            exc_info=True,
-        )
-        raise
+        start_time = time.perf_counter()
+        try:
+            response = await call_next(request)
+            process_time = time.perf_counter() - start_time
+
+            logger.info(
+                "request_completed",
+                method=request.method,
+                path=request.url.path,
+                status_code=response.status_code,
+                process_time_ms=round(process_time * 1000, 2),
+            )
+
+            # Add correlation ID to response headers
+            response.headers["X-Correlation-ID"] = correlation_id
+            return response
+        except Exception as e:
+            process_time = time.perf_counter() - start_time
+            logger.error(
+                "request_failed",
+                method=request.method,
+                path=request.url.path,
+                error=str(e),
+                error_type=type(e).__name__,
+                process_time_ms=round(process_time * 1000, 2),
+                exc_info=True,
+            )
+            raise
 
 
 app.include_router(router)
 
 
-@app.get("/health")
-def health_check():
-    """Health check endpoint"""
-    container_name = os.getenv("HOSTNAME", socket.gethostname())
-    return {"status": "healthy", "service": "account-service", "container": container_name}
+@app.on_event("startup")
+def startup_event():
+    """Warm up the RabbitMQ publisher channel on application startup"""
+    publisher.warmup()
 
 
-@app.get("/")
-def root():
-    """Root endpoint"""
-    return {
+@app.on_event("shutdown")
+def shutdown_event():
+    """Release pooled database connections on application shutdown"""
+    if engine is not None:
+        engine.dispose()
+
+
+# Static endpoint bodies serialized once at import; the container name is
+# fixed for the lifetime of the process
+_HEALTH_BODY = orjson.dumps(
+    {"status": "healthy", "service": "account-service", "container": os.getenv("HOSTNAME", socket.gethostname())}
+)
+_ROOT_BODY = orjson.dumps(
+    {
         "service": "account-service",
         "version": "1.0.0",
         "endpoints": {
             "POST /accounts": "Create new account",
+            "POST /accounts/bulk": "Create many accounts",
             "GET /accounts/{id}": "Get account balance",
             "PUT /accounts/{id}/deposit": "Deposit funds",
             "PUT /accounts/{id}/withdraw": "Withdraw funds",
         },
     }
+)
+
+
+@app.get("/health")
+def health_check():
+    """Health check endpoint"""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+@app.get("/")
+def root():
+    """Root endpoint"""
+    return Response(content=_ROOT_BODY, media_type="application/json")
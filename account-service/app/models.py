@@ -1,14 +1,27 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime
+from decimal import Decimal
+
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+_CENT = Decimal("0.01")
+
 
 class Account(Base):
     __tablename__ = "accounts"
 
-    id = Column(Integer, primary_key=True, index=True)
-    account_number = Column(String, unique=True, index=True, nullable=False)
-    balance = Column(Numeric(10, 2), default=0.00, nullable=False)
+    # Primary key is already indexed; the unique constraint's btree serves
+    # account_number lookups, so no extra index on either column
+    id = Column(Integer, primary_key=True)
+    account_number = Column(String, unique=True, nullable=False)
+    # Stored as integer cents: native int arithmetic in SQL and Python
+    # instead of Numeric/Decimal on every balance mutation
+    balance_cents = Column(BigInteger, default=0, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())  # pylint: disable=not-callable
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())  # pylint: disable=not-callable
+
+    @property
+    def balance(self) -> Decimal:
+        """Balance in currency units, exposed as a two-place Decimal at the API boundary"""
+        return (Decimal(self.balance_cents or 0) / 100).quantize(_CENT)
@@ -1,96 +1,273 @@
-import json
+import atexit
 import os
+import queue
+import threading
 from datetime import datetime
 from decimal import Decimal
 
+import orjson
 import pika
+import pika.exceptions
 import structlog
 
-from shared.events import TransactionEvent
 from shared.logging_config import get_logger
 from shared.prometheus import record_publish
 
 logger = get_logger(__name__)
 
+# Transient messages (delivery_mode=1) skip the broker's disk fsync per
+# message; set RABBITMQ_PERSISTENT=true where at-least-once across broker
+# restarts is required.
+_PERSISTENT = os.getenv("RABBITMQ_PERSISTENT", "false").lower() in ("1", "true", "yes")
+_DELIVERY_MODE = 2 if _PERSISTENT else 1
+
+# Broker configuration read once at import; misconfiguration surfaces at
+# process start (via warmup) instead of on the first transaction
+_RABBITMQ_HOST = os.getenv("RABBITMQ_HOST")
+_RABBITMQ_PORT = os.getenv("RABBITMQ_PORT")
+_RABBITMQ_USER = os.getenv("RABBITMQ_USER")
+_RABBITMQ_PASSWORD = os.getenv("RABBITMQ_PASSWORD")
+RABBITMQ_QUEUE = os.getenv("RABBITMQ_QUEUE")
+
+_CONNECTION_PARAMS = None
+if all([_RABBITMQ_HOST, _RABBITMQ_PORT, _RABBITMQ_USER, _RABBITMQ_PASSWORD]):
+    _CONNECTION_PARAMS = pika.ConnectionParameters(
+        host=_RABBITMQ_HOST,
+        port=int(_RABBITMQ_PORT),
+        credentials=pika.PlainCredentials(_RABBITMQ_USER, _RABBITMQ_PASSWORD),
+    )
+
+# Each worker thread owns its own connection and channel (pika channels are
+# not thread-safe), reused across requests instead of reconnecting per call.
+_local = threading.local()
+_declared_queues_lock = threading.Lock()
+_declared_queues = set()
+
+# Request handlers enqueue events here; a single daemon thread drains the
+# queue in batches so the request path never waits on the broker.
+_QUEUE_MAXSIZE = 10_000
+_BATCH_SIZE = 64
+_event_queue: "queue.Queue" = queue.Queue(maxsize=_QUEUE_MAXSIZE)
+_drain_thread = None
+_drain_thread_lock = threading.Lock()
+_shutdown = threading.Event()
+
+
+def get_connection_parameters():
+    """Return the connection parameters built at import"""
+    if _CONNECTION_PARAMS is None:
+        raise RuntimeError("RabbitMQ environment variables are not set")
+    return _CONNECTION_PARAMS
+
 
 def get_connection():
     """Create and return RabbitMQ connection"""
-    rabbitmq_host = os.getenv("RABBITMQ_HOST")
-    rabbitmq_port_str = os.getenv("RABBITMQ_PORT")
-    rabbitmq_user = os.getenv("RABBITMQ_USER")
-    rabbitmq_password = os.getenv("RABBITMQ_PASSWORD")
+    return pika.BlockingConnection(get_connection_parameters())
 
-    if not all([rabbitmq_host, rabbitmq_port_str, rabbitmq_user, rabbitmq_password]):
-        raise RuntimeError("RabbitMQ environment variables are not set")
 
-    rabbitmq_port = int(rabbitmq_port_str)
-    credentials = pika.PlainCredentials(rabbitmq_user, rabbitmq_password)
-    parameters = pika.ConnectionParameters(host=rabbitmq_host, port=rabbitmq_port, credentials=credentials)
-    return pika.BlockingConnection(parameters)
+def _declare_queue(channel, queue_name: str):
+    """Declare the queue once per process (idempotent on the broker side)"""
+    with _declared_queues_lock:
+        if queue_name not in _declared_queues:
+            channel.queue_declare(queue=queue_name, durable=True)
+            _declared_queues.add(queue_name)
+
+
+def _get_channel(queue_name: str):
+    """Get (or lazily create) this thread's persistent confirm-enabled channel"""
+    connection = getattr(_local, "connection", None)
+    channel = getattr(_local, "channel", None)
+
+    if connection is None or not connection.is_open or channel is None or not channel.is_open:
+        connection = get_connection()
+        channel = connection.channel()
+        channel.confirm_delivery()
+        _local.connection = connection
+        _local.channel = channel
+        logger.info("rabbitmq_publisher_channel_opened")
+
+    _declare_queue(channel, queue_name)
+    return channel
+
+
+def _reset_channel():
+    """Drop this thread's cached connection/channel after a failure"""
+    connection = getattr(_local, "connection", None)
+    _local.connection = None
+    _local.channel = None
+    if connection is not None and connection.is_open:
+        try:
+            connection.close()
+        except pika.exceptions.AMQPError:
+            pass
+
+
+def _publish_now(rabbitmq_queue: str, message: str, properties: pika.BasicProperties):
+    """Publish a single message on the persistent channel, reconnecting once on stale sockets"""
+    try:
+        channel = _get_channel(rabbitmq_queue)
+        channel.basic_publish(exchange="", routing_key=rabbitmq_queue, body=message, properties=properties)
+    except (pika.exceptions.StreamLostError, pika.exceptions.ChannelClosed, pika.exceptions.ConnectionClosed):
+        _reset_channel()
+        channel = _get_channel(rabbitmq_queue)
+        channel.basic_publish(exchange="", routing_key=rabbitmq_queue, body=message, properties=properties)
+    record_publish(exchange="", routing_key=rabbitmq_queue)
+
+
+def _drain_loop():
+    """Drain enqueued events in batches on a dedicated publisher thread"""
+    # Open the channel on this thread so the broker handshake never runs on
+    # (and never blocks) the uvicorn event loop; publishes reuse it via the
+    # thread-local cache.
+    if RABBITMQ_QUEUE:
+        try:
+            _get_channel(RABBITMQ_QUEUE)
+            logger.info("rabbitmq_publisher_warmed_up", queue=RABBITMQ_QUEUE)
+        except (pika.exceptions.AMQPError, ConnectionError, RuntimeError) as e:
+            logger.warning(
+                "rabbitmq_publisher_warmup_failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+    while not _shutdown.is_set():
+        try:
+            batch = [_event_queue.get(timeout=0.5)]
+        except queue.Empty:
+            continue
+        while len(batch) < _BATCH_SIZE:
+            try:
+                batch.append(_event_queue.get_nowait())
+            except queue.Empty:
+                break
+        _publish_batch(batch)
+
+
+def _publish_batch(batch):
+    for item in batch:
+        try:
+            _publish_now(item["queue"], item["message"], item["properties"])
+            logger.info(
+                "transaction_event_published",
+                transaction_type=item["transaction_type"],
+                account_id=item["account_id"],
+                account_number=item["account_number"],
+                amount=item["amount"],
+                queue=item["queue"],
+                correlation_id=item["correlation_id"],
+            )
+        except (pika.exceptions.AMQPError, ConnectionError, RuntimeError) as e:
+            logger.error(
+                "transaction_event_publish_failed",
+                transaction_type=item["transaction_type"],
+                account_id=item["account_id"],
+                account_number=item["account_number"],
+                amount=item["amount"],
+                correlation_id=item["correlation_id"],
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+        finally:
+            _event_queue.task_done()
+
+
+def _ensure_drain_thread():
+    """Start the background publisher thread once per process"""
+    global _drain_thread  # pylint: disable=global-statement
+    with _drain_thread_lock:
+        if _drain_thread is None or not _drain_thread.is_alive():
+            _drain_thread = threading.Thread(target=_drain_loop, name="rabbitmq-publisher", daemon=True)
+            _drain_thread.start()
+
+
+def warmup():
+    """Start the publisher thread at startup without blocking the event loop.
+
+    The broker handshake and queue declaration happen on the publisher
+    thread itself, so FastAPI startup (which runs on the event loop) only
+    pays the cost of spawning the thread. Safe to call when RabbitMQ is not
+    configured (e.g. in unit tests).
+    """
+    if not RABBITMQ_QUEUE or _CONNECTION_PARAMS is None:
+        logger.warning("rabbitmq_publisher_warmup_skipped", reason="rabbitmq_environment_not_configured")
+        return
+    _ensure_drain_thread()
+
+
+@atexit.register
+def close_publisher():
+    """Flush pending events and close the cached connection at process shutdown"""
+    _shutdown.set()
+    pending = []
+    while True:
+        try:
+            pending.append(_event_queue.get_nowait())
+        except queue.Empty:
+            break
+    if pending:
+        try:
+            _publish_batch(pending)
+        except (pika.exceptions.AMQPError, ConnectionError, RuntimeError):
+            logger.warning("rabbitmq_publisher_shutdown_flush_failed", dropped_events=len(pending))
+    _reset_channel()
 
 
 def publish_transaction_event(account_id: int, account_number: str, amount: Decimal, transaction_type: str):
-    """Publish transaction event to RabbitMQ"""
+    """Enqueue a transaction event for batched publishing to RabbitMQ"""
     # Get correlation ID from context if available
     context = structlog.contextvars.get_contextvars()
     correlation_id = context.get("correlation_id", "unknown")
 
-    try:
-        rabbitmq_queue = os.getenv("RABBITMQ_QUEUE")
-        if not rabbitmq_queue:
-            raise RuntimeError("RABBITMQ_QUEUE environment variable is not set")
+    rabbitmq_queue = RABBITMQ_QUEUE
+    if not rabbitmq_queue:
+        raise RuntimeError("RABBITMQ_QUEUE environment variable is not set")
 
-        connection = get_connection()
-        channel = connection.channel()
+    # Serialize the event directly with orjson; the consumer validates the
+    # payload against shared.events.TransactionEvent, so building (and
+    # re-validating) the Pydantic model here is pure overhead.
+    message = orjson.dumps(
+        {
+            "account_id": account_id,
+            "account_number": account_number,
+            "amount": str(amount),
+            "transaction_type": transaction_type,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    )
 
-        # Declare queue (idempotent operation)
-        channel.queue_declare(queue=rabbitmq_queue, durable=True)
-
-        # Create event
-        event = TransactionEvent(
-            account_id=account_id,
-            account_number=account_number,
-            amount=amount,
-            transaction_type=transaction_type,
-            timestamp=datetime.utcnow(),
-        )
-
-        # Publish message
-        message = json.dumps(event.model_dump(), default=str)
-        channel.basic_publish(
-            exchange="",
-            routing_key=rabbitmq_queue,
-            body=message,
-            properties=pika.BasicProperties(
-                delivery_mode=2,  # Make message persistent
-                headers={"correlation_id": correlation_id},  # Add correlation ID for tracing
-            ),
-        )
-
-        record_publish(exchange="", routing_key=rabbitmq_queue)
-
-        logger.info(
-            "transaction_event_published",
-            transaction_type=transaction_type,
-            account_id=account_id,
-            account_number=account_number,
-            amount=str(amount),
-            queue=rabbitmq_queue,
-            correlation_id=correlation_id,
-        )
-        connection.close()
-
-    except (ConnectionError, ValueError, RuntimeError) as e:
-        logger.error(
-            "transaction_event_publish_failed",
-            transaction_type=transaction_type,
-            account_id=account_id,
-            account_number=account_number,
-            amount=str(amount),
-            correlation_id=correlation_id,
-            error=str(e),
-            error_type=type(e).__name__,
-            exc_info=True,
-        )
-        # In production, you might want to raise or handle this differently
-        raise
+    item = {
+        "queue": rabbitmq_queue,
+        "message": message,
+        "properties": pika.BasicProperties(
+            delivery_mode=_DELIVERY_MODE,
+            headers={"correlation_id": correlation_id},  # Add correlation ID for tracing
+        ),
+        "transaction_type": transaction_type,
+        "account_id": account_id,
+        "account_number": account_number,
+        "amount": str(amount),
+        "correlation_id": correlation_id,
+    }
+
+    _ensure_drain_thread()
+    try:
+        _event_queue.put_nowait(item)
+    except queue.Full:
+        # Backlog is saturated; publish synchronously rather than drop the event
+        logger.warning("rabbitmq_publisher_queue_full", queue_size=_QUEUE_MAXSIZE)
+        try:
+            _publish_now(rabbitmq_queue, item["message"], item["properties"])
+        except (pika.exceptions.AMQPError, ConnectionError, RuntimeError) as e:
+            logger.error(
+                "transaction_event_publish_failed",
+                transaction_type=transaction_type,
+                account_id=account_id,
+                account_number=account_number,
+                amount=str(amount),
+                correlation_id=correlation_id,
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+            # In production, you might want to raise or handle this differently
+            raise
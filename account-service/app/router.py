@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app import service
-from app.schemas import AccountCreate, AccountResponse, DepositRequest, WithdrawRequest
+from app.schemas import AccountBulkCreate, AccountCreate, AccountResponse, DepositRequest, WithdrawRequest
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
@@ -19,6 +21,21 @@ def create_account(account_data: AccountCreate, db: Session = Depends(get_db)):
     return account
 
 
+@router.post("/bulk", response_model=List[AccountResponse], status_code=status.HTTP_201_CREATED)
+def create_accounts_bulk(bulk_data: AccountBulkCreate, db: Session = Depends(get_db)):
+    """Create many accounts at once (e.g. for seeding)"""
+    numbers = bulk_data.account_numbers
+    if len(set(numbers)) != len(numbers):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Duplicate account numbers in request")
+
+    existing = service.get_accounts_by_numbers(db, numbers)
+    if existing:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Account number already exists")
+
+    accounts = service.create_accounts(db, numbers)
+    return accounts
+
+
 @router.get("/{account_id}", response_model=AccountResponse)
 def get_account(account_id: int, db: Session = Depends(get_db)):
     """Get account balance by ID"""
@@ -29,19 +46,21 @@ def get_account(account_id: int, db: Session = Depends(get_db)):
 
 
 @router.put("/{account_id}/deposit", response_model=AccountResponse)
-def deposit(account_id: int, deposit_data: DepositRequest, db: Session = Depends(get_db)):
+def deposit(account_id: int, deposit_data: DepositRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """Deposit funds to account"""
-    account = service.deposit(db, account_id, deposit_data.amount)
+    account = service.deposit(db, account_id, deposit_data.amount, background_tasks=background_tasks)
     if not account:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
     return account
 
 
 @router.put("/{account_id}/withdraw", response_model=AccountResponse)
-def withdraw(account_id: int, withdraw_data: WithdrawRequest, db: Session = Depends(get_db)):
+def withdraw(
+    account_id: int, withdraw_data: WithdrawRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+):
     """Withdraw funds from account"""
     try:
-        account = service.withdraw(db, account_id, withdraw_data.amount)
+        account = service.withdraw(db, account_id, withdraw_data.amount, background_tasks=background_tasks)
         if not account:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
         return account
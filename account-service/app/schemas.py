@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -9,6 +9,10 @@ class AccountCreate(BaseModel):
     account_number: str = Field(..., description="Unique account number")
 
 
+class AccountBulkCreate(BaseModel):
+    account_numbers: List[str] = Field(..., min_length=1, description="Unique account numbers to create")
+
+
 class AccountResponse(BaseModel):
     id: int
     account_number: str
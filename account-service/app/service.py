@@ -1,5 +1,9 @@
-from decimal import Decimal
+import logging
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional
 
+from fastapi import BackgroundTasks
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from shared.logging_config import get_logger, mask_account_number, mask_balance, mask_amount
@@ -8,10 +12,40 @@ from app.models import Account
 
 logger = get_logger(__name__)
 
+# Stdlib handle for cheap isEnabledFor checks before building log kwargs
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _publish_or_defer(
+    background_tasks: Optional[BackgroundTasks],
+    account_id: int,
+    account_number: str,
+    amount: Decimal,
+    transaction_type: str,
+):
+    """Schedule the event publish after the response when BackgroundTasks is available"""
+    if background_tasks is not None:
+        background_tasks.add_task(
+            publisher.publish_transaction_event,
+            account_id=account_id,
+            account_number=account_number,
+            amount=amount,
+            transaction_type=transaction_type,
+        )
+    else:
+        publisher.publish_transaction_event(
+            account_id=account_id, account_number=account_number, amount=amount, transaction_type=transaction_type
+        )
+
+
+def _to_cents(amount: Decimal) -> int:
+    """Convert a currency amount to integer cents, rounding half-up"""
+    return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
 
 def create_account(db: Session, account_number: str):
     """Create a new account"""
-    account = Account(account_number=account_number, balance=Decimal("0.00"))
+    account = Account(account_number=account_number, balance_cents=0)
     db.add(account)
     db.commit()
     db.refresh(account)
@@ -24,9 +58,23 @@ def create_account(db: Session, account_number: str):
     return account
 
 
+def create_accounts(db: Session, account_numbers: list):
+    """Create many accounts in a single INSERT round trip"""
+    stmt = insert(Account).returning(Account)
+    rows = [{"account_number": number, "balance_cents": 0} for number in account_numbers]
+    accounts = db.execute(stmt, rows).scalars().all()
+    # Detach before commit so the instances keep their RETURNING-loaded state
+    # instead of being expired (which would refresh each one with a SELECT)
+    db.expunge_all()
+    db.commit()
+    logger.info("accounts_created_bulk", count=len(accounts))
+    return accounts
+
+
 def get_account(db: Session, account_id: int):
     """Get account by ID"""
-    return db.query(Account).filter(Account.id == account_id).first()
+    # Session.get hits the identity map first and skips the query compile
+    return db.get(Account, account_id)
 
 
 def get_account_by_number(db: Session, account_number: str):
@@ -34,39 +82,54 @@ def get_account_by_number(db: Session, account_number: str):
     return db.query(Account).filter(Account.account_number == account_number).first()
 
 
-def deposit(db: Session, account_id: int, amount: Decimal):
+def get_accounts_by_numbers(db: Session, account_numbers: list):
+    """Get all accounts whose account number is in the given list"""
+    return db.query(Account).filter(Account.account_number.in_(account_numbers)).all()
+
+
+def deposit(db: Session, account_id: int, amount: Decimal, background_tasks: Optional[BackgroundTasks] = None):
     """Deposit funds to account"""
-    account = get_account(db, account_id)
+    # Single atomic UPDATE instead of SELECT-mutate-UPDATE-refresh
+    stmt = (
+        update(Account)
+        .where(Account.id == account_id)
+        .values(balance_cents=Account.balance_cents + _to_cents(amount))
+        .returning(Account)
+    )
+    account = db.execute(stmt).scalar_one_or_none()
     if not account:
+        db.rollback()
         logger.warning("deposit_failed", reason="account_not_found", account_id=account_id)
         return None
 
-    old_balance = account.balance
-    account.balance += amount
+    # Capture values before commit expires the instance; stringify once
+    account_number = account.account_number
+    new_balance = account.balance
+    old_balance = new_balance - amount
+    amount_str = str(amount)
     db.commit()
-    db.refresh(account)
 
-    # Publish transaction event
+    # Publish transaction event; with background_tasks the publish is
+    # fire-and-forget after the response, keeping broker RTT off the request path
     try:
-        publisher.publish_transaction_event(
-            account_id=account.id, account_number=account.account_number, amount=amount, transaction_type="deposit"
-        )
-        logger.info(
-            "deposit_successful",
-            account_id=account_id,
-            account_number=mask_account_number(account.account_number),
-            amount=mask_amount(str(amount)),
-            old_balance=mask_balance(str(old_balance)),
-            new_balance=mask_balance(str(account.balance)),
-        )
+        _publish_or_defer(background_tasks, account_id, account_number, amount, "deposit")
+        if _stdlib_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "deposit_successful",
+                account_id=account_id,
+                account_number=mask_account_number(account_number),
+                amount=mask_amount(amount_str),
+                old_balance=mask_balance(str(old_balance)),
+                new_balance=mask_balance(str(new_balance)),
+            )
     except (ConnectionError, ValueError, RuntimeError) as e:
         logger.error(
             "deposit_event_publish_failed",
             account_id=account_id,
-            account_number=mask_account_number(account.account_number),
-            amount=mask_amount(str(amount)),
+            account_number=mask_account_number(account_number),
+            amount=mask_amount(amount_str),
             old_balance=mask_balance(str(old_balance)),
-            new_balance=mask_balance(str(account.balance)),
+            new_balance=mask_balance(str(new_balance)),
             error=str(e),
             error_type=type(e).__name__,
         )
@@ -74,50 +137,64 @@ def deposit(db: Session, account_id: int, amount: Decimal):
     return account
 
 
-def withdraw(db: Session, account_id: int, amount: Decimal):
+def withdraw(db: Session, account_id: int, amount: Decimal, background_tasks: Optional[BackgroundTasks] = None):
     """Withdraw funds from account"""
-    account = get_account(db, account_id)
+    # Atomic guarded UPDATE: the balance check happens in the same statement
+    # as the debit, closing the check-then-update race
+    amount_cents = _to_cents(amount)
+    stmt = (
+        update(Account)
+        .where(Account.id == account_id)
+        .where(Account.balance_cents >= amount_cents)
+        .values(balance_cents=Account.balance_cents - amount_cents)
+        .returning(Account)
+    )
+    account = db.execute(stmt).scalar_one_or_none()
     if not account:
-        logger.warning("withdraw_failed", reason="account_not_found", account_id=account_id)
-        return None
-
-    if account.balance < amount:
+        db.rollback()
+        # Distinguish a missing account from insufficient funds
+        existing = get_account(db, account_id)
+        if not existing:
+            logger.warning("withdraw_failed", reason="account_not_found", account_id=account_id)
+            return None
         logger.warning(
             "withdraw_failed",
             reason="insufficient_funds",
             account_id=account_id,
-            account_number=mask_account_number(account.account_number),
+            account_number=mask_account_number(existing.account_number),
             requested_amount=mask_amount(str(amount)),
-            current_balance=mask_balance(str(account.balance)),
+            current_balance=mask_balance(str(existing.balance)),
         )
         raise ValueError("Insufficient funds")
 
-    old_balance = account.balance
-    account.balance -= amount
+    # Capture values before commit expires the instance; stringify once
+    account_number = account.account_number
+    new_balance = account.balance
+    old_balance = new_balance + amount
+    amount_str = str(amount)
     db.commit()
-    db.refresh(account)
 
-    # Publish transaction event
+    # Publish transaction event; with background_tasks the publish is
+    # fire-and-forget after the response, keeping broker RTT off the request path
     try:
-        publisher.publish_transaction_event(
-            account_id=account.id, account_number=account.account_number, amount=amount, transaction_type="withdraw"
-        )
-        logger.info(
-            "withdraw_successful",
-            account_id=account_id,
-            account_number=mask_account_number(account.account_number),
-            amount=mask_amount(str(amount)),
-            old_balance=mask_balance(str(old_balance)),
-            new_balance=mask_balance(str(account.balance)),
-        )
+        _publish_or_defer(background_tasks, account_id, account_number, amount, "withdraw")
+        if _stdlib_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "withdraw_successful",
+                account_id=account_id,
+                account_number=mask_account_number(account_number),
+                amount=mask_amount(amount_str),
+                old_balance=mask_balance(str(old_balance)),
+                new_balance=mask_balance(str(new_balance)),
+            )
     except (ConnectionError, ValueError, RuntimeError) as e:
         logger.error(
             "withdraw_event_publish_failed",
             account_id=account_id,
-            account_number=mask_account_number(account.account_number),
-            amount=mask_amount(str(amount)),
+            account_number=mask_account_number(account_number),
+            amount=mask_amount(amount_str),
             old_balance=mask_balance(str(old_balance)),
-            new_balance=mask_balance(str(account.balance)),
+            new_balance=mask_balance(str(new_balance)),
             error=str(e),
             error_type=type(e).__name__,
         )
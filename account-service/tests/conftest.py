@@ -7,36 +7,63 @@ from fastapi.testclient import TestClient
 from app.database import Base, get_db
 from app.main import app
 
+# Holder the session-scoped client reads the current test's session from
+_current_db = {"db": None}
 
-@pytest.fixture
-def test_db():
-    """Create a test database in memory"""
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Create the in-memory test database engine once per session"""
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
     Base.metadata.create_all(bind=engine)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def test_db(db_engine):
+    """Provide an isolated database session per test.
+
+    Each test runs inside an outer transaction on a shared connection;
+    commits in application code land on SAVEPOINTs, and the outer
+    transaction is rolled back on teardown, so tests stay independent
+    without rebuilding the schema every time.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    TestingSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=connection, join_transaction_mode="create_savepoint"
+    )
+
     db = TestingSessionLocal()
     try:
         yield db
     finally:
         db.close()
-    
-    Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
-@pytest.fixture
-def client(test_db):
-    """Create a test client with database override"""
+@pytest.fixture(autouse=True)
+def _bind_test_db(test_db):
+    """Point the app's get_db override at this test's session"""
+    _current_db["db"] = test_db
+    yield
+    _current_db["db"] = None
+
+
+@pytest.fixture(scope="session")
+def client(db_engine):
+    """Create a test client once per session with database override"""
+
     def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
-    
+        yield _current_db["db"]
+
     app.dependency_overrides[get_db] = override_get_db
     yield TestClient(app)
     app.dependency_overrides.clear()
@@ -46,15 +73,16 @@ def client(test_db):
 def mock_publisher(monkeypatch):
     """Mock the publisher to avoid actual RabbitMQ calls"""
     published_events = []
-    
+
     def mock_publish(account_id, account_number, amount, transaction_type):
-        published_events.append({
-            "account_id": account_id,
-            "account_number": account_number,
-            "amount": amount,
-            "transaction_type": transaction_type
-        })
-    
+        published_events.append(
+            {
+                "account_id": account_id,
+                "account_number": account_number,
+                "amount": amount,
+                "transaction_type": transaction_type,
+            }
+        )
+
     monkeypatch.setattr("app.service.publisher.publish_transaction_event", mock_publish)
     return published_events
-
@@ -95,3 +95,20 @@ def test_withdraw_account_not_found(client):
     response = client.put("/accounts/99999/withdraw", json={"amount": "50.00"})
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
+
+
+def test_create_accounts_bulk_endpoint(client):
+    """Test POST /accounts/bulk endpoint"""
+    response = client.post("/accounts/bulk", json={"account_numbers": ["ACC_BULK_001", "ACC_BULK_002"]})
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert len(data) == 2
+    assert {d["account_number"] for d in data} == {"ACC_BULK_001", "ACC_BULK_002"}
+
+
+def test_create_accounts_bulk_duplicate(client):
+    """Test bulk creation rejects existing account numbers"""
+    client.post("/accounts", json={"account_number": "ACC_BULK_DUP"})
+    response = client.post("/accounts/bulk", json={"account_numbers": ["ACC_BULK_DUP", "ACC_BULK_NEW"]})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "already exists" in response.json()["detail"]
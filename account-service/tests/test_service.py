@@ -98,3 +98,12 @@ def test_withdraw_exact_balance(test_db, mock_publisher):
     updated = service.withdraw(test_db, account.id, Decimal("100.00"))
     assert updated.balance == Decimal("0.00")
 
+
+
+def test_create_accounts_bulk(test_db):
+    """Test creating multiple accounts in one call"""
+    accounts = service.create_accounts(test_db, ["BULK001", "BULK002", "BULK003"])
+    assert len(accounts) == 3
+    assert all(a.id is not None for a in accounts)
+    assert {a.account_number for a in accounts} == {"BULK001", "BULK002", "BULK003"}
+    assert all(a.balance == Decimal("0.00") for a in accounts)
@@ -17,6 +17,9 @@ MAX_INSTANCES = int(os.getenv('MAX_INSTANCES', '5'))
 # Cooldown period in minutes (prevent rapid scaling)
 SCALING_COOLDOWN_MINUTES = int(os.getenv('SCALING_COOLDOWN_MINUTES', '5'))
 
+# Optional shared cooldown store; when unset, cooldowns are tracked in-process
+REDIS_URL = os.getenv('REDIS_URL')
+
 # Docker network name (from Ansible defaults)
 DOCKER_NETWORK = os.getenv('DOCKER_NETWORK', 'banking-network')
 
@@ -1,13 +1,82 @@
 """Helper functions for autoscaling operations."""
-import json
-import subprocess
+import functools
+import logging
 import re
-from datetime import datetime, timedelta
+import time
 from typing import Dict, List, Optional
-from app.config import SCALING_COOLDOWN_MINUTES, DOCKER_NETWORK, DOCKER_QUERY_TIMEOUT
 
-# Track last scaling action per service and action type
-_last_scaling_actions: Dict[str, datetime] = {}
+import docker
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+from app.config import SCALING_COOLDOWN_MINUTES, REDIS_URL, DOCKER_NETWORK, DOCKER_QUERY_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# Cooldown length precomputed once; monotonic timestamps are immune to
+# wall-clock jumps (NTP) that could otherwise bypass or extend cooldowns
+_COOLDOWN_SECS = SCALING_COOLDOWN_MINUTES * 60
+
+# Track last scaling action per service and action type (in-process fallback
+# used when REDIS_URL is unset; with multiple autoscale replicas, cooldowns
+# must live in Redis or each replica will trigger its own scaling action)
+_last_scaling_actions: Dict[str, float] = {}
+
+_redis_client = None
+
+# Base-container config changes at most on deployment; cache inspect results
+# briefly so back-to-back scale ups skip the daemon round trip
+_BASE_INFO_TTL_SECS = 60
+_base_info_cache: Dict[str, tuple] = {}
+
+# Container counts only change through our own scaling actions (or a deploy),
+# so a short TTL collapses alert bursts into one daemon query per prefix
+_COUNT_TTL_SECS = 5.0
+_last_known_count: Dict[str, tuple] = {}
+
+
+def record_container_count(container_prefix: str, count: int):
+    """Cache the container count reached by a successful scaling action."""
+    _last_known_count[container_prefix] = (count, time.monotonic())
+
+
+def invalidate_container_count(container_prefix: str):
+    """Drop the cached count, e.g. after a failed scaling action."""
+    _last_known_count.pop(container_prefix, None)
+
+
+def _get_redis():
+    """Get (or lazily create) the Redis client for shared cooldown state."""
+    global _redis_client  # pylint: disable=global-statement
+    if _redis_client is None and REDIS_URL and redis is not None:
+        _redis_client = redis.Redis.from_url(REDIS_URL)
+    return _redis_client
+
+# Shared Docker SDK client: talks HTTP over /var/run/docker.sock with a
+# keep-alive connection, so container queries skip the fork/exec of the
+# docker CLI. Created lazily so importing the app never requires a daemon.
+_docker_client: Optional[docker.DockerClient] = None
+
+
+def get_docker_client() -> docker.DockerClient:
+    """Get (or lazily create) the shared Docker client."""
+    global _docker_client  # pylint: disable=global-statement
+    if _docker_client is None:
+        _docker_client = docker.from_env(timeout=DOCKER_QUERY_TIMEOUT)
+    return _docker_client
+
+
+@functools.lru_cache(maxsize=32)
+def _numbered_pattern(container_prefix: str) -> re.Pattern:
+    """Compiled pattern matching numbered instances (prefix-N), cached per prefix.
+
+    MULTILINE so one findall over a newline-joined name list replaces a
+    Python-level match loop per container name.
+    """
+    return re.compile(rf'^{re.escape(container_prefix)}-(\d+)$', re.MULTILINE)
 
 
 def can_scale(container_prefix: str, action: str) -> bool:
@@ -21,114 +90,137 @@ def can_scale(container_prefix: str, action: str) -> bool:
         True if scaling is allowed, False if cooldown period is active
     """
     key = f"{container_prefix}:{action}"
+
+    client = _get_redis()
+    if client is not None:
+        try:
+            if client.exists(f'cooldown:{key}'):
+                logger.debug('Cooldown active for %s %s', container_prefix, action)
+                return False
+            return True
+        except redis.RedisError as e:
+            logger.warning('Redis cooldown check failed, falling back to in-memory: %s', e)
+
     last_action = _last_scaling_actions.get(key)
-    
+
     if last_action is None:
         return True  # No previous action, allow scaling
-    
-    time_since_last = datetime.now() - last_action
-    cooldown = timedelta(minutes=SCALING_COOLDOWN_MINUTES)
-    
-    if time_since_last < cooldown:
-        remaining = cooldown - time_since_last
-        print(f"Cooldown active for {container_prefix} {action}: {remaining.seconds}s remaining")
+
+    elapsed = time.monotonic() - last_action
+
+    if elapsed < _COOLDOWN_SECS:
+        remaining = int(_COOLDOWN_SECS - elapsed)
+        logger.debug('Cooldown active for %s %s: %ss remaining', container_prefix, action, remaining)
         return False
-    
+
     return True
 
 
 def record_scaling_action(container_prefix: str, action: str):
     """Record the timestamp of a scaling action."""
     key = f"{container_prefix}:{action}"
-    _last_scaling_actions[key] = datetime.now()
-    print(f"Recorded {action} action for {container_prefix} at {datetime.now()}")
 
+    client = _get_redis()
+    if client is not None:
+        try:
+            # TTL makes the cooldown expire on its own; no cleanup needed
+            client.set(f'cooldown:{key}', '1', ex=_COOLDOWN_SECS)
+            logger.info('Recorded %s action for %s in Redis', action, container_prefix)
+            return
+        except redis.RedisError as e:
+            logger.warning('Redis cooldown record failed, falling back to in-memory: %s', e)
+
+    _last_scaling_actions[key] = time.monotonic()
+    logger.info('Recorded %s action for %s', action, container_prefix)
+
+
+def list_containers(container_prefix: str) -> List[str]:
+    """List running container names matching a prefix with a single daemon query.
+
+    Args:
+        container_prefix: Container name prefix (e.g., 'banking-account-service')
+
+    Returns:
+        List of container names (unfiltered beyond the docker name filter)
+    """
+    containers = get_docker_client().containers.list(filters={'name': container_prefix})
+    return [container.name for container in containers]
 
-def get_container_count(container_prefix: str) -> int:
+
+def get_container_count(
+    container_prefix: str, containers: Optional[List[str]] = None, force: bool = False
+) -> int:
     """Get current container count for a service.
-    
+
     Looks for containers matching the prefix pattern:
     - banking-account-service (base container)
     - banking-account-service-1, banking-account-service-2, etc. (scaled instances)
-    
+
     Args:
         container_prefix: Container name prefix (e.g., 'banking-account-service')
-    
+        containers: Optional pre-fetched container list (avoids another docker ps)
+        force: Skip the short-lived count cache and query the daemon
+
     Returns:
         Number of running containers for the service
     """
     try:
-        # Get all containers with the prefix in their name
-        result = subprocess.run(
-            ['docker', 'ps', '--filter', f'name={container_prefix}', '--format', '{{.Names}}'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=DOCKER_QUERY_TIMEOUT
-        )
-        containers = [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
-        
-        # Count containers that match the pattern (base or numbered instances)
-        count = 0
-        for container in containers:
-            # Match base container (exact match) or numbered instances (prefix-N)
-            if container == container_prefix or re.match(rf'^{re.escape(container_prefix)}-\d+$', container):
-                count += 1
-        
-        return count if count > 0 else 1  # Default to 1 if no containers found
+        if containers is None and not force:
+            cached = _last_known_count.get(container_prefix)
+            if cached is not None and time.monotonic() - cached[1] < _COUNT_TTL_SECS:
+                return cached[0]
+
+        if containers is None:
+            containers = list_containers(container_prefix)
+
+        # Count base container (exact match) plus numbered instances (prefix-N)
+        # with a single C-level regex scan over the joined name list
+        count = len(_numbered_pattern(container_prefix).findall('\n'.join(containers)))
+        if container_prefix in containers:
+            count += 1
+
+        count = count if count > 0 else 1  # Default to 1 if no containers found
+        record_container_count(container_prefix, count)
+        return count
     except Exception as e:
-        print(f"Error getting container count: {e}")
+        logger.error('Error getting container count: %s', e)
         return 1
 
 
-def get_base_container_info(container_prefix: str) -> dict:
+def get_base_container_info(container_prefix: str, containers: Optional[List[str]] = None) -> dict:
     """Get image, environment variables, and other config from the base container.
-    
+
     Args:
         container_prefix: Container name prefix (e.g., 'banking-account-service')
-    
+        containers: Optional pre-fetched container list (avoids another docker ps)
+
     Returns:
         Dictionary with container configuration (image, env, labels, restart_policy, port_bindings)
-    
+
     Raises:
         Exception: If base container not found or inspect fails
     """
     try:
-        # First, try to find the base container (exact name match)
-        result = subprocess.run(
-            ['docker', 'ps', '--filter', f'name=^{container_prefix}$', '--format', '{{.Names}}'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=DOCKER_QUERY_TIMEOUT
-        )
-        base_container = result.stdout.strip()
-        
-        # If base container not found, try to find any numbered instance
-        if not base_container:
-            result = subprocess.run(
-                ['docker', 'ps', '--filter', f'name={container_prefix}', '--format', '{{.Names}}'],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=DOCKER_QUERY_TIMEOUT
-            )
-            containers = [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
-            if containers:
-                base_container = containers[0]
-        
+        if containers is None:
+            containers = list_containers(container_prefix)
+
+        # Prefer the base container (exact name match), fall back to any instance
+        base_container = None
+        if container_prefix in containers:
+            base_container = container_prefix
+        elif containers:
+            base_container = containers[0]
+
         if not base_container:
             raise Exception(f"No base container found for {container_prefix}")
-        
-        # Get container inspect info
-        inspect_result = subprocess.run(
-            ['docker', 'inspect', base_container],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=DOCKER_QUERY_TIMEOUT
-        )
-        container_info = json.loads(inspect_result.stdout)[0]
+
+        now = time.monotonic()
+        cached = _base_info_cache.get(base_container)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        # containers.get is a single inspect call; attrs is the already-parsed dict
+        container_info = get_docker_client().containers.get(base_container).attrs
         
         # Extract image
         image = container_info['Config']['Image']
@@ -145,49 +237,43 @@ def get_base_container_info(container_prefix: str) -> dict:
         # Extract port mappings (if any)
         port_bindings = container_info['HostConfig']['PortBindings'] or {}
         
-        return {
+        info = {
             'image': image,
             'env': env_vars,
             'labels': labels,
             'restart_policy': restart_policy,
             'port_bindings': port_bindings
         }
+        _base_info_cache[base_container] = (now + _BASE_INFO_TTL_SECS, info)
+        return info
     except Exception as e:
         raise Exception(f"Failed to get base container info: {e}")
 
 
-def get_existing_container_numbers(container_prefix: str) -> List[Optional[int]]:
+def get_existing_container_numbers(
+    container_prefix: str, containers: Optional[List[str]] = None
+) -> List[Optional[int]]:
     """Get list of existing container numbers (None for base container, int for numbered).
-    
+
     Args:
         container_prefix: Container name prefix (e.g., 'banking-account-service')
-    
+        containers: Optional pre-fetched container list (avoids another docker ps)
+
     Returns:
         List of container numbers (None for base, int for numbered instances)
     """
     try:
-        result = subprocess.run(
-            ['docker', 'ps', '--filter', f'name={container_prefix}', '--format', '{{.Names}}'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=DOCKER_QUERY_TIMEOUT
-        )
-        containers = [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
-        
-        numbers = []
-        for container in containers:
-            if container == container_prefix:
-                # Base container
-                numbers.append(None)
-            else:
-                # Numbered container - extract number
-                match = re.match(rf'^{re.escape(container_prefix)}-(\d+)$', container)
-                if match:
-                    numbers.append(int(match.group(1)))
-        
+        if containers is None:
+            containers = list_containers(container_prefix)
+
+        # One regex scan for all numbered instances; base container is None
+        numbers: List[Optional[int]] = []
+        if container_prefix in containers:
+            numbers.append(None)
+        numbers.extend(int(m) for m in _numbered_pattern(container_prefix).findall('\n'.join(containers)))
+
         return numbers
     except Exception as e:
-        print(f"Error getting container numbers: {e}")
+        logger.error('Error getting container numbers: %s', e)
         return []
 
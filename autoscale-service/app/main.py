@@ -1,13 +1,30 @@
 """Minimal auto-scaling webhook service."""
+import atexit
+import logging
+import logging.handlers
+import queue
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 from app.router import router
 
-app = FastAPI(title="Auto-Scaling Service", version="1.0.0")
+# Queue-backed logging: handlers emit from a background thread, so webhook
+# handling never blocks on a stdout write under alert storms
+_log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s %(message)s'))
+_root_logger = logging.getLogger()
+_root_logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+app = FastAPI(title="Auto-Scaling Service", version="1.0.0", default_response_class=ORJSONResponse)
 app.include_router(router)
 
 # Add Prometheus metrics instrumentation
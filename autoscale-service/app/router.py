@@ -1,4 +1,6 @@
 """Auto-scaling webhook endpoint."""
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 from app.schemas import WebhookPayload
 from app.service import process_webhook_alerts
@@ -9,18 +11,20 @@ router = APIRouter()
 @router.post("/webhook/autoscale")
 async def autoscale_webhook(payload: WebhookPayload):
     """Receive Grafana alert webhook and trigger scaling.
-    
+
     Args:
         payload: Webhook payload from Grafana containing alert information
-    
+
     Returns:
         Dictionary with status and results
-    
+
     Raises:
         HTTPException: If processing fails
     """
     try:
-        result = process_webhook_alerts(payload)
+        # Docker calls block; run them on a worker thread so concurrent
+        # webhook posts don't serialize behind each other on the event loop
+        result = await asyncio.to_thread(process_webhook_alerts, payload)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process webhook: {str(e)}")
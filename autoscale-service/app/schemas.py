@@ -1,19 +1,30 @@
 """Webhook payload schemas."""
-from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from typing import Dict, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+# Grafana sends far more fields than we read; extra='ignore' drops them at
+# parse time, and frozen models skip per-instance __setattr__ machinery
+_WEBHOOK_CONFIG = ConfigDict(extra='ignore', frozen=True)
 
 
 class AlertLabel(BaseModel):
+    model_config = _WEBHOOK_CONFIG
+
     service: Optional[str] = ""
     alertname: Optional[str] = ""
     job: Optional[str] = ""
 
 
 class Alert(BaseModel):
+    model_config = _WEBHOOK_CONFIG
+
     status: str
     labels: AlertLabel
-    annotations: Dict[str, Any] = {}
+    # str values let pydantic-core emit a specialized validator instead of Any
+    annotations: Dict[str, str] = Field(default_factory=dict)
 
 
 class WebhookPayload(BaseModel):
+    model_config = _WEBHOOK_CONFIG
+
     alerts: list[Alert]
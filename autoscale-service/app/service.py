@@ -1,16 +1,25 @@
 """Auto-scaling service logic."""
-import subprocess
+import logging
 from typing import Optional
+
+import docker.errors
+
 from app.schemas import WebhookPayload
-from app.config import SERVICE_MAP, CONTAINER_TO_SERVICE, MIN_INSTANCES, MAX_INSTANCES, DOCKER_NETWORK, DOCKER_TIMEOUT, CONTAINER_STOP_TIMEOUT
+from app.config import SERVICE_MAP, CONTAINER_TO_SERVICE, MIN_INSTANCES, MAX_INSTANCES, DOCKER_NETWORK, CONTAINER_STOP_TIMEOUT
 from app.helpers import (
     can_scale,
     record_scaling_action,
+    record_container_count,
+    invalidate_container_count,
+    get_docker_client,
+    list_containers,
     get_container_count,
     get_base_container_info,
     get_existing_container_numbers
 )
 
+logger = logging.getLogger(__name__)
+
 
 def process_webhook_alerts(payload: WebhookPayload) -> dict:
     """Process webhook alerts and trigger scaling actions.
@@ -33,8 +42,9 @@ def process_webhook_alerts(payload: WebhookPayload) -> dict:
         if not service:
             continue
         
-        # Map service names to container name prefix
-        container_prefix = SERVICE_MAP.get(service, f'banking-{service}')
+        # Map service names to container name prefix (lazy fallback so the
+        # f-string is only built on a miss)
+        container_prefix = SERVICE_MAP.get(service) or f'banking-{service}'
         
         # Determine action
         action = determine_scaling_action(alertname)
@@ -74,31 +84,47 @@ def scale_service(container_prefix: str, action: str) -> dict:
     Raises:
         Exception: If scaling fails
     """
-    # Check cooldown period
-    if not can_scale(container_prefix, action):
-        return {
-            'success': False,
-            'message': f'Skipping {action} for {container_prefix}: cooldown period active'
-        }
-    
+    # Bounds check first, served from the count cache when fresh: a service
+    # pinned at MAX/MIN under sustained alerts rejects without touching
+    # Docker or cooldown state
     current = get_container_count(container_prefix)
     new_count = min(current + 1, MAX_INSTANCES) if action == 'scale_up' else max(current - 1, MIN_INSTANCES)
-    
+
     # Idempotency check: already at target count
     if new_count == current:
         return {
             'success': False,
             'message': f'Skipping {action} for {container_prefix}: already at target count {current}'
         }
-    
+
+    # Check cooldown period
+    if not can_scale(container_prefix, action):
+        return {
+            'success': False,
+            'message': f'Skipping {action} for {container_prefix}: cooldown period active'
+        }
+
+    # One container listing for the scaling action itself; the helpers
+    # below reuse it for numbering and base-container selection
+    try:
+        containers = list_containers(container_prefix)
+    except Exception as e:
+        logger.error('Error listing containers: %s', e)
+        containers = None
+
     # Perform scaling
-    if action == 'scale_up':
-        scale_up(container_prefix, new_count)
-    else:
-        scale_down(container_prefix, new_count)
-    
-    # Record scaling action timestamp
+    try:
+        if action == 'scale_up':
+            scale_up(container_prefix, new_count, containers=containers)
+        else:
+            scale_down(container_prefix, new_count, containers=containers)
+    except Exception:
+        invalidate_container_count(container_prefix)
+        raise
+
+    # Record scaling action timestamp and the count it reached
     record_scaling_action(container_prefix, action)
+    record_container_count(container_prefix, new_count)
     
     return {
         'success': True,
@@ -106,22 +132,23 @@ def scale_service(container_prefix: str, action: str) -> dict:
     }
 
 
-def scale_up(container_prefix: str, target_count: int):
+def scale_up(container_prefix: str, target_count: int, containers=None):
     """Scale up by creating new containers.
-    
+
     Args:
         container_prefix: Container name prefix (e.g., 'banking-account-service')
         target_count: Target number of containers
-    
+        containers: Optional pre-fetched container list from list_containers
+
     Raises:
         Exception: If scaling fails
     """
     try:
         # Get base container info
-        base_info = get_base_container_info(container_prefix)
-        
+        base_info = get_base_container_info(container_prefix, containers=containers)
+
         # Get existing container numbers
-        existing_numbers = get_existing_container_numbers(container_prefix)
+        existing_numbers = get_existing_container_numbers(container_prefix, containers=containers)
         
         # Find the next available number
         next_number = 1
@@ -130,71 +157,65 @@ def scale_up(container_prefix: str, target_count: int):
             next_number += 1
         
         new_container_name = f"{container_prefix}-{next_number}"
-        
-        # Build docker run command
-        cmd = ['docker', 'run', '-d']
-        
-        # Container name
-        cmd.extend(['--name', new_container_name])
-        
-        # Network
-        cmd.extend(['--network', DOCKER_NETWORK])
-        
-        # Add network alias for load balancing (e.g., account-service)
-        # This allows nginx to discover all instances via DNS
-        service_name = CONTAINER_TO_SERVICE.get(container_prefix, container_prefix.replace('banking-', ''))
-        cmd.extend(['--network-alias', service_name])
-        
+
+        client = get_docker_client()
+
+        # Labels (copy from base container, plus a marker for scaled instances)
+        labels = dict(base_info['labels'])
+        labels['scaled-instance'] = 'true'
+
         # Restart policy
+        restart_policy = None
         if base_info['restart_policy'] != 'no':
-            cmd.extend(['--restart', base_info['restart_policy']])
-        
-        # Environment variables
-        for env_var in base_info['env']:
-            cmd.extend(['-e', env_var])
-        
-        # Labels (copy from base container)
-        for key, value in base_info['labels'].items():
-            cmd.extend(['--label', f'{key}={value}'])
-        
-        # Add a label to identify this as a scaled instance
-        cmd.extend(['--label', 'scaled-instance=true'])
-        
-        # Image
-        cmd.append(base_info['image'])
-        
-        # Execute docker run
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=DOCKER_TIMEOUT)
-        print(f"Scaled up {container_prefix}: created {new_container_name}")
-        
-    except subprocess.CalledProcessError as e:
-        raise Exception(f"Docker run failed: {e.stderr}")
+            restart_policy = {'Name': base_info['restart_policy']}
+
+        # Create the container detached from the network first, then attach
+        # with a network alias for load balancing (e.g., account-service).
+        # This allows nginx to discover all instances via DNS; the high-level
+        # run() API cannot set aliases, so create/connect/start is used.
+        service_name = CONTAINER_TO_SERVICE.get(container_prefix) or container_prefix.removeprefix('banking-')
+        container = client.containers.create(
+            base_info['image'],
+            name=new_container_name,
+            environment=base_info['env'],
+            labels=labels,
+            restart_policy=restart_policy,
+            detach=True
+        )
+        client.networks.get(DOCKER_NETWORK).connect(container, aliases=[service_name])
+        container.start()
+
+        logger.info('Scaled up %s: created %s', container_prefix, new_container_name)
+
+    except docker.errors.APIError as e:
+        raise Exception(f"Docker run failed: {e}")
     except Exception as e:
         raise Exception(f"Scale up failed: {e}")
 
 
-def scale_down(container_prefix: str, target_count: int):
+def scale_down(container_prefix: str, target_count: int, containers=None):
     """Scale down by stopping and removing the highest numbered container.
-    
+
     Args:
         container_prefix: Container name prefix (e.g., 'banking-account-service')
         target_count: Target number of containers
-    
+        containers: Optional pre-fetched container list from list_containers
+
     Raises:
         Exception: If scaling fails
     """
     try:
         # Get existing container numbers
-        existing_numbers = get_existing_container_numbers(container_prefix)
+        existing_numbers = get_existing_container_numbers(container_prefix, containers=containers)
         
         if not existing_numbers:
-            print(f"No containers found to scale down for {container_prefix}")
+            logger.info('No containers found to scale down for %s', container_prefix)
             return
         
         # Find the highest numbered container (not the base container)
         numbered_containers = [n for n in existing_numbers if n is not None]
         if not numbered_containers:
-            print(f"No numbered containers found to scale down for {container_prefix}")
+            logger.info('No numbered containers found to scale down for %s', container_prefix)
             return
         
         # Remove the highest numbered container
@@ -202,13 +223,14 @@ def scale_down(container_prefix: str, target_count: int):
         container_to_remove = f"{container_prefix}-{highest_number}"
         
         # Stop and remove container
-        subprocess.run(['docker', 'stop', container_to_remove], check=True, timeout=CONTAINER_STOP_TIMEOUT)
-        subprocess.run(['docker', 'rm', container_to_remove], check=True, timeout=CONTAINER_STOP_TIMEOUT)
-        
-        print(f"Scaled down {container_prefix}: removed {container_to_remove}")
-        
-    except subprocess.CalledProcessError as e:
-        raise Exception(f"Docker stop/rm failed: {e.stderr}")
+        container = get_docker_client().containers.get(container_to_remove)
+        container.stop(timeout=CONTAINER_STOP_TIMEOUT)
+        container.remove()
+
+        logger.info('Scaled down %s: removed %s', container_prefix, container_to_remove)
+
+    except docker.errors.APIError as e:
+        raise Exception(f"Docker stop/rm failed: {e}")
     except Exception as e:
         raise Exception(f"Scale down failed: {e}")
 
@@ -241,4 +263,4 @@ def map_service_name(prometheus_job: str) -> str:
     Returns:
         Docker container name prefix (e.g., 'banking-account-service')
     """
-    return SERVICE_MAP.get(prometheus_job, f'banking-{prometheus_job}')
+    return SERVICE_MAP.get(prometheus_job) or f'banking-{prometheus_job}'
@@ -0,0 +1,112 @@
+"""Shared fixtures for autoscale tests: all Docker daemon access is faked."""
+import pytest
+from fastapi.testclient import TestClient
+
+from app import helpers
+from app.main import app
+
+_BASE_ATTRS = {
+    'Config': {
+        'Image': 'banking-account-service:latest',
+        'Env': ['DATABASE_URL=postgresql://db/banking'],
+        'Labels': {'com.example.project': 'banking'},
+    },
+    'HostConfig': {
+        'RestartPolicy': {'Name': 'unless-stopped'},
+        'PortBindings': {},
+    },
+}
+
+
+class FakeContainer:
+    def __init__(self, name, attrs=None):
+        self.name = name
+        self.attrs = attrs or _BASE_ATTRS
+        self.started = False
+        self.stopped = False
+        self.removed = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self, timeout=None):
+        self.stopped = True
+
+    def remove(self):
+        self.removed = True
+
+
+class FakeNetwork:
+    def __init__(self):
+        self.connected = []
+
+    def connect(self, container, aliases=None):
+        self.connected.append((container.name, aliases))
+
+
+class FakeContainers:
+    def __init__(self, client):
+        self._client = client
+
+    def list(self, filters=None):
+        prefix = (filters or {}).get('name', '')
+        return [c for c in self._client.running if c.name.startswith(prefix)]
+
+    def get(self, name):
+        for container in self._client.running:
+            if container.name == name:
+                return container
+        raise Exception(f'No such container: {name}')
+
+    def create(self, image, **kwargs):
+        container = FakeContainer(kwargs.get('name'))
+        self._client.created.append((image, kwargs))
+        self._client.running.append(container)
+        return container
+
+
+class FakeDockerClient:
+    """In-memory stand-in for docker.from_env() so tests never need a daemon."""
+
+    def __init__(self, names):
+        self.running = [FakeContainer(name) for name in names]
+        self.created = []
+        self.network = FakeNetwork()
+        self.containers = FakeContainers(self)
+
+    class _Networks:
+        def __init__(self, network):
+            self._network = network
+
+        def get(self, name):
+            return self._network
+
+    @property
+    def networks(self):
+        return self._Networks(self.network)
+
+
+@pytest.fixture
+def mock_docker(monkeypatch):
+    """Install a fake Docker client with a single base container per service."""
+    client = FakeDockerClient(['banking-account-service', 'banking-transaction-service'])
+    monkeypatch.setattr(helpers, '_docker_client', client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    """Clear in-memory cooldown and inspect-cache state between tests."""
+    helpers._last_scaling_actions.clear()
+    helpers._base_info_cache.clear()
+    helpers._last_known_count.clear()
+    yield
+    helpers._last_scaling_actions.clear()
+    helpers._base_info_cache.clear()
+    helpers._last_known_count.clear()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client once per session."""
+    return TestClient(app)
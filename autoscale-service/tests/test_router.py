@@ -0,0 +1,40 @@
+def test_health_check(client):
+    response = client.get('/health')
+    assert response.status_code == 200
+    assert response.json() == {'status': 'healthy'}
+
+
+def test_webhook_firing_alert_scales_up(client, mock_docker):
+    payload = {
+        'alerts': [
+            {
+                'status': 'firing',
+                'labels': {'service': 'account-service', 'alertname': 'HighCPUUsage'},
+            }
+        ]
+    }
+
+    response = client.post('/webhook/autoscale', json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data['status'] == 'ok'
+    assert data['results'][0]['success'] is True
+    assert mock_docker.created[0][1]['name'] == 'banking-account-service-1'
+
+
+def test_webhook_ignores_resolved_alerts(client, mock_docker):
+    payload = {
+        'alerts': [
+            {
+                'status': 'resolved',
+                'labels': {'service': 'account-service', 'alertname': 'HighCPUUsage'},
+            }
+        ]
+    }
+
+    response = client.post('/webhook/autoscale', json=payload)
+
+    assert response.status_code == 200
+    assert response.json()['results'] == []
+    assert mock_docker.created == []
@@ -0,0 +1,70 @@
+import pytest
+
+from app.helpers import get_container_count, get_existing_container_numbers
+from app.service import determine_scaling_action, map_service_name, scale_service
+
+
+def test_determine_scaling_action():
+    assert determine_scaling_action('HighCPUUsage') == 'scale_up'
+    assert determine_scaling_action('low_traffic_scale_down') == 'scale_down'
+    assert determine_scaling_action('SomethingElse') is None
+
+
+def test_map_service_name():
+    assert map_service_name('account-service') == 'banking-account-service'
+    assert map_service_name('unknown-service') == 'banking-unknown-service'
+
+
+def test_get_container_count(mock_docker):
+    assert get_container_count('banking-account-service') == 1
+
+    mock_docker.running.append(type(mock_docker.running[0])('banking-account-service-1'))
+    # Within the TTL the cached count is served; force re-queries the daemon
+    assert get_container_count('banking-account-service') == 1
+    assert get_container_count('banking-account-service', force=True) == 2
+
+
+def test_get_existing_container_numbers(mock_docker):
+    mock_docker.running.append(type(mock_docker.running[0])('banking-account-service-2'))
+    numbers = get_existing_container_numbers('banking-account-service')
+    assert numbers == [None, 2]
+
+
+def test_scale_up_creates_next_numbered_container(mock_docker):
+    result = scale_service('banking-account-service', 'scale_up')
+
+    assert result['success'] is True
+    image, kwargs = mock_docker.created[0]
+    assert image == 'banking-account-service:latest'
+    assert kwargs['name'] == 'banking-account-service-1'
+    assert kwargs['labels']['scaled-instance'] == 'true'
+    # New instance is attached to the network under the service alias
+    assert mock_docker.network.connected == [('banking-account-service-1', ['account-service'])]
+
+
+def test_scale_down_removes_highest_numbered_container(mock_docker):
+    FakeContainer = type(mock_docker.running[0])
+    mock_docker.running.append(FakeContainer('banking-account-service-1'))
+    highest = FakeContainer('banking-account-service-2')
+    mock_docker.running.append(highest)
+
+    result = scale_service('banking-account-service', 'scale_down')
+
+    assert result['success'] is True
+    assert highest.stopped and highest.removed
+
+
+def test_scale_down_skips_at_min_instances(mock_docker):
+    result = scale_service('banking-account-service', 'scale_down')
+
+    assert result['success'] is False
+    assert 'already at target count' in result['message']
+
+
+def test_cooldown_blocks_repeated_scaling(mock_docker):
+    first = scale_service('banking-account-service', 'scale_up')
+    second = scale_service('banking-account-service', 'scale_up')
+
+    assert first['success'] is True
+    assert second['success'] is False
+    assert 'cooldown' in second['message']
@@ -5,6 +5,38 @@ from decimal import Decimal
 from sqlalchemy import text
 import pytest
 
+# Propagation through RabbitMQ typically completes in tens of milliseconds,
+# so poll tightly; each loop checks before it ever sleeps
+POLL_INTERVAL = 0.05
+
+# Built once so SQLAlchemy reuses the compiled form across invocations;
+# selecting just the amount keeps the wire payload minimal
+_VERIFY_DEPOSIT_SQL = text(
+    "SELECT amount FROM transactions"
+    " WHERE account_id = :account_id AND transaction_type = 'deposit' LIMIT 1"
+)
+
+
+def wait_until(predicate, timeout=10.0, interval=POLL_INTERVAL):
+    """Poll predicate until it returns truthy or the timeout elapses.
+
+    Returns as soon as the condition holds, so tests pace themselves on
+    actual event propagation instead of fixed sleeps.
+    """
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return False
+
+
+def get_transactions(transaction_service_client, account_id):
+    """Fetch the transaction list for an account."""
+    response = transaction_service_client.get(f"/transactions?account_id={account_id}")
+    assert response.status_code == 200
+    return response.json()
+
 
 class TestAccountToTransactionFlow:
     """Test end-to-end flow from account service to transaction service."""
@@ -14,17 +46,10 @@ class TestAccountToTransactionFlow:
         account_service_client,
         transaction_service_client,
         test_db_session,
+        fresh_account,
     ):
         """Test that depositing to an account creates a transaction record."""
-        # Create account
-        account_number = f"TEST_{int(time.time())}"
-        create_response = account_service_client.post(
-            "/accounts", json={"account_number": account_number}
-        )
-        assert create_response.status_code == 201
-        account_data = create_response.json()
-        account_id = account_data["id"]
-        assert account_data["balance"] == "0.00"
+        account_id, account_number = fresh_account
 
         # Deposit funds
         deposit_amount = "150.75"
@@ -57,18 +82,13 @@ class TestAccountToTransactionFlow:
                 transaction_found = True
                 break
 
-            time.sleep(0.5)
+            time.sleep(POLL_INTERVAL)
 
         assert transaction_found, "Transaction was not created within timeout period"
 
         # Verify in database directly
-        result = test_db_session.execute(
-            text(
-                "SELECT * FROM transactions WHERE account_id = :account_id AND transaction_type = 'deposit'"
-            ),
-            {"account_id": account_id},
-        )
-        db_transaction = result.fetchone()
+        result = test_db_session.execute(_VERIFY_DEPOSIT_SQL, {"account_id": account_id})
+        db_transaction = result.first()
         assert db_transaction is not None
         assert str(db_transaction.amount) == deposit_amount
 
@@ -77,15 +97,10 @@ class TestAccountToTransactionFlow:
         account_service_client,
         transaction_service_client,
         test_db_session,
+        fresh_account,
     ):
         """Test that withdrawing from an account creates a transaction record."""
-        # Create account
-        account_number = f"TEST_{int(time.time())}"
-        create_response = account_service_client.post(
-            "/accounts", json={"account_number": account_number}
-        )
-        assert create_response.status_code == 201
-        account_id = create_response.json()["id"]
+        account_id, account_number = fresh_account
 
         # Deposit first
         deposit_response = account_service_client.put(
@@ -93,8 +108,13 @@ class TestAccountToTransactionFlow:
         )
         assert deposit_response.status_code == 200
 
-        # Wait for deposit transaction
-        time.sleep(2)
+        # Wait for the deposit transaction to arrive (async message consumption)
+        assert wait_until(
+            lambda: any(
+                t["transaction_type"] == "deposit"
+                for t in get_transactions(transaction_service_client, account_id)
+            )
+        ), "Deposit transaction was not created within timeout period"
 
         # Withdraw funds
         withdraw_amount = "75.50"
@@ -128,7 +148,7 @@ class TestAccountToTransactionFlow:
                     withdrawal_found = True
                     break
 
-            time.sleep(0.5)
+            time.sleep(POLL_INTERVAL)
 
         assert withdrawal_found, "Withdrawal transaction was not created within timeout period"
 
@@ -136,21 +156,21 @@ class TestAccountToTransactionFlow:
         self,
         account_service_client,
         transaction_service_client,
+        fresh_account,
     ):
         """Test that multiple transactions are recorded in correct order."""
-        # Create account
-        account_number = f"TEST_{int(time.time())}"
-        create_response = account_service_client.post(
-            "/accounts", json={"account_number": account_number}
-        )
-        assert create_response.status_code == 201
-        account_id = create_response.json()["id"]
+        account_id, account_number = fresh_account
 
-        # Perform multiple operations
+        # Perform multiple operations, waiting for each transaction to land
+        # before issuing the next so ordering is deterministic
         account_service_client.put(f"/accounts/{account_id}/deposit", json={"amount": "100.00"})
-        time.sleep(1)
+        assert wait_until(
+            lambda: len(get_transactions(transaction_service_client, account_id)) >= 1
+        ), "First deposit was not recorded within timeout period"
         account_service_client.put(f"/accounts/{account_id}/deposit", json={"amount": "50.00"})
-        time.sleep(1)
+        assert wait_until(
+            lambda: len(get_transactions(transaction_service_client, account_id)) >= 2
+        ), "Second deposit was not recorded within timeout period"
         account_service_client.put(f"/accounts/{account_id}/withdraw", json={"amount": "25.00"})
 
         # Wait for all transactions to be processed
@@ -178,7 +198,7 @@ class TestAccountToTransactionFlow:
                 all_transactions_found = True
                 break
 
-            time.sleep(0.5)
+            time.sleep(POLL_INTERVAL)
 
         assert all_transactions_found, "Not all transactions were created within timeout period"
 
@@ -186,15 +206,10 @@ class TestAccountToTransactionFlow:
         self,
         account_service_client,
         transaction_service_client,
+        fresh_account,
     ):
         """Test that transactions appear in transaction service history."""
-        # Create account
-        account_number = f"TEST_{int(time.time())}"
-        create_response = account_service_client.post(
-            "/accounts", json={"account_number": account_number}
-        )
-        assert create_response.status_code == 201
-        account_id = create_response.json()["id"]
+        account_id, account_number = fresh_account
 
         # Deposit
         account_service_client.put(f"/accounts/{account_id}/deposit", json={"amount": "99.99"})
@@ -227,21 +242,16 @@ class TestAccountToTransactionFlow:
                 assert len(matching) == 1
                 break
 
-            time.sleep(0.5)
+            time.sleep(POLL_INTERVAL)
 
     def test_insufficient_funds_does_not_create_transaction(
         self,
         account_service_client,
         transaction_service_client,
+        fresh_account,
     ):
         """Test that failed withdrawal due to insufficient funds doesn't create transaction."""
-        # Create account
-        account_number = f"TEST_{int(time.time())}"
-        create_response = account_service_client.post(
-            "/accounts", json={"account_number": account_number}
-        )
-        assert create_response.status_code == 201
-        account_id = create_response.json()["id"]
+        account_id, account_number = fresh_account
 
         # Try to withdraw without funds
         withdraw_response = account_service_client.put(
@@ -13,17 +13,20 @@ Run with: locust -f locustfile.py --host=http://localhost:8000
 
 import random
 import time
-import threading
-from decimal import Decimal
-from locust import HttpUser, task, between, events
+from collections import deque
+from locust import task, between, events
+from locust.contrib.fasthttp import FastHttpUser
 
-# Shared list to track account IDs created by BankingUser instances
-# This allows TransactionServiceUser to query only existing accounts
-_known_account_ids = []
-_account_ids_lock = threading.Lock()
+# Shared ring of account IDs created by BankingUser instances; lets
+# TransactionServiceUser query only existing accounts. Bounded so multi-hour
+# soak tests keep constant memory (oldest IDs fall off the end).
+# No lock needed: Locust users in a worker run as cooperative gevent
+# greenlets, and append/index access never yields mid-operation. Multi-worker
+# runs keep an independent ring per process, which is fine for load shaping.
+_known_account_ids = deque(maxlen=10_000)
 
 
-class BankingUser(HttpUser):
+class BankingUser(FastHttpUser):
     """
     Simulates a banking user performing various operations.
     
@@ -38,9 +41,14 @@ class BankingUser(HttpUser):
     # Account service runs on port 8000
     host = "http://localhost:8000"
     wait_time = between(1, 3)  # Wait 1-3 seconds between tasks
+    connection_timeout = 5.0
+    network_timeout = 10.0
     account_id = None
     account_number = None
-    
+    # Local balance estimate, refreshed from every mutating response; saves a
+    # GET round trip before each withdrawal
+    _balance = 0.0
+
     def on_start(self):
         """Called when a simulated user starts. Creates an account."""
         # Create a unique account for this user
@@ -53,15 +61,16 @@ class BankingUser(HttpUser):
         if response.status_code == 201:
             data = response.json()
             self.account_id = data["id"]
-            # Add account ID to shared list for TransactionServiceUser
-            with _account_ids_lock:
-                _known_account_ids.append(self.account_id)
+            # Add account ID to shared ring for TransactionServiceUser
+            _known_account_ids.append(self.account_id)
             # Initial deposit to have funds available
-            self.client.put(
+            deposit_response = self.client.put(
                 f"/accounts/{self.account_id}/deposit",
                 json={"amount": "1000.00"},
                 name="Initial Deposit"
             )
+            if deposit_response.status_code == 200:
+                self._balance = float(deposit_response.json()["balance"])
     
     @task(3)
     def check_balance(self):
@@ -76,58 +85,58 @@ class BankingUser(HttpUser):
     def deposit_funds(self):
         """Deposit funds - common operation."""
         if self.account_id:
-            amount = round(random.uniform(10.00, 500.00), 2)
-            self.client.put(
+            # Integer cents: one randint plus integer formatting, with no
+            # float-rounding edge cases at the two-decimal boundary
+            cents = random.randint(1000, 50000)
+            response = self.client.put(
                 f"/accounts/{self.account_id}/deposit",
-                json={"amount": str(amount)},
+                json={"amount": f"{cents // 100}.{cents % 100:02d}"},
                 name="Deposit Funds"
             )
+            if response.status_code == 200:
+                self._balance = float(response.json()["balance"])
     
     @task(1)
     def withdraw_funds(self):
-        """Withdraw funds - common operation. Ensures withdrawal is within account balance."""
-        if self.account_id:
-            # First, get the current account balance
-            balance_response = self.client.get(
-                f"/accounts/{self.account_id}",
-                name="Get Account Balance (for withdrawal check)"
+        """Withdraw funds - common operation. Stays within the local balance estimate."""
+        if not self.account_id:
+            return
+
+        # Use the local estimate instead of a GET before every withdrawal;
+        # plain float math since this only picks a random bound
+        current_balance = self._balance
+
+        # Only withdraw if balance is sufficient (at least $10)
+        if current_balance < 10.00:
+            return
+
+        # Calculate maximum withdrawal: up to 90% of balance, capped at $200
+        # and at the actual balance, so we don't drain the account completely
+        max_withdrawal = min(current_balance * 0.9, 200.00, current_balance)
+
+        # Only proceed if we can withdraw at least the minimum
+        if max_withdrawal >= 10.00:
+            # Generate a random amount between min and max in integer cents
+            cents = random.randint(1000, int(max_withdrawal * 100))
+
+            response = self.client.put(
+                f"/accounts/{self.account_id}/withdraw",
+                json={"amount": f"{cents // 100}.{cents % 100:02d}"},
+                name="Withdraw Funds"
             )
-            
-            if balance_response.status_code == 200:
-                account_data = balance_response.json()
-                current_balance = Decimal(str(account_data["balance"]))
-                
-                # Only withdraw if balance is sufficient (at least $10)
-                if current_balance >= Decimal("10.00"):
-                    # Calculate maximum withdrawal: up to 90% of balance, capped at $200
-                    # This ensures we don't drain the account completely
-                    max_withdrawal_pct = current_balance * Decimal("0.9")
-                    max_withdrawal = min(max_withdrawal_pct, Decimal("200.00"))
-                    
-                    # Ensure max withdrawal doesn't exceed actual balance
-                    max_withdrawal = min(max_withdrawal, current_balance)
-                    
-                    min_withdrawal = Decimal("10.00")
-                    
-                    # Only proceed if we can withdraw at least the minimum
-                    if max_withdrawal >= min_withdrawal:
-                        # Generate random amount between min and max
-                        amount = round(
-                            random.uniform(
-                                float(min_withdrawal),
-                                float(max_withdrawal)
-                            ),
-                            2
-                        )
-                        
-                        self.client.put(
-                            f"/accounts/{self.account_id}/withdraw",
-                            json={"amount": str(amount)},
-                            name="Withdraw Funds"
-                        )
-
-
-class TransactionServiceUser(HttpUser):
+            if response.status_code == 200:
+                self._balance = float(response.json()["balance"])
+            elif response.status_code == 400:
+                # Estimate drifted (e.g. insufficient funds); resync once
+                resync = self.client.get(
+                    f"/accounts/{self.account_id}",
+                    name="Resync Balance"
+                )
+                if resync.status_code == 200:
+                    self._balance = float(resync.json()["balance"])
+
+
+class TransactionServiceUser(FastHttpUser):
     """
     Simulates queries to the transaction service.
     
@@ -140,6 +149,8 @@ class TransactionServiceUser(HttpUser):
     # Transaction service runs on port 8001
     host = "http://localhost:8001"
     wait_time = between(0.5, 2)
+    connection_timeout = 5.0
+    network_timeout = 10.0
     
     @task(5)
     def get_all_transactions(self):
@@ -154,14 +165,13 @@ class TransactionServiceUser(HttpUser):
     @task(2)
     def get_transactions_by_account(self):
         """Get transactions for a specific account that exists."""
-        # Get account ID from the shared list of known accounts
-        with _account_ids_lock:
-            if _known_account_ids:
-                # Select a random account from known accounts
-                account_id = random.choice(_known_account_ids)
-            else:
-                # If no accounts exist yet, skip this task
-                return
+        # Get account ID from the shared ring of known accounts
+        if not _known_account_ids:
+            # If no accounts exist yet, skip this task
+            return
+        # Select a random account (index access; random.choice does not
+        # support deques)
+        account_id = _known_account_ids[random.randrange(len(_known_account_ids))]
         
         # Query transactions for this account
         self.client.get(
@@ -6,6 +6,42 @@ import json
 import sys
 import os
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _read_severity_counts(report_path: str):
+    """Read the two severity counters, streaming when ijson is available.
+
+    Streaming scans just the metrics keys instead of materializing the whole
+    report, which for big scans is the difference between two counters and
+    the full document in memory.
+    """
+    if ijson is not None:
+        high_count = medium_count = 0
+        with open(report_path, 'rb') as f:
+            for key, value in ijson.kvitems(f, 'metrics'):
+                if key == 'SEVERITY.HIGH':
+                    high_count = value
+                elif key == 'SEVERITY.MEDIUM':
+                    medium_count = value
+        return high_count, medium_count
+
+    # orjson's C parser is several times faster than stdlib json; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so existing handling holds
+    with open(report_path, 'rb') as f:
+        raw = f.read()
+    report = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    metrics = report.get('metrics', {})
+    return metrics.get('SEVERITY.HIGH', 0), metrics.get('SEVERITY.MEDIUM', 0)
+
 
 def check_bandit_results(report_path: str, service_name: str, max_high: int = 0, max_medium: int = 10) -> int:
     """
@@ -25,13 +61,8 @@ def check_bandit_results(report_path: str, service_name: str, max_high: int = 0,
         return 0
     
     try:
-        with open(report_path, 'r') as f:
-            report = json.load(f)
-        
-        metrics = report.get('metrics', {})
-        high_count = metrics.get('SEVERITY.HIGH', 0)
-        medium_count = metrics.get('SEVERITY.MEDIUM', 0)
-        
+        high_count, medium_count = _read_severity_counts(report_path)
+
         print(f"Bandit Scan Results for {service_name}:")
         print(f"  HIGH severity issues: {high_count} (threshold: {max_high})")
         print(f"  MEDIUM severity issues: {medium_count} (threshold: {max_medium})")
@@ -6,7 +6,7 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_serializer
 
 
 class TransactionType(str, Enum):
@@ -19,14 +19,11 @@ class TransactionType(str, Enum):
 class TransactionEvent(BaseModel):
     """Standard transaction event schema"""
 
-    account_id: int
-    account_number: str
-    amount: Decimal
-    transaction_type: str  # "deposit" or "withdraw"
-    timestamp: datetime
-
-    class Config:
-        json_schema_extra = {
+    # Native v2 config: the inner-Config compat shim is skipped at class
+    # construction, and instances are never re-validated when passed around
+    model_config = ConfigDict(
+        revalidate_instances="never",
+        json_schema_extra={
             "example": {
                 "account_id": 1,
                 "account_number": "ACC123456",
@@ -34,7 +31,26 @@ class TransactionEvent(BaseModel):
                 "transaction_type": "deposit",
                 "timestamp": "2024-01-01T12:00:00",
             }
-        }
+        },
+    )
+
+    account_id: int
+    account_number: str
+    amount: Decimal
+    # Typed as the enum so pydantic-core validates against the small interned
+    # value set instead of running generic str validation
+    transaction_type: TransactionType
+    timestamp: datetime
+
+    @field_serializer("amount")
+    def serialize_amount(self, amount: Decimal) -> str:
+        """Serialize amount as a string so model_dump_json matches the wire format"""
+        return str(amount)
+
+    @field_serializer("timestamp")
+    def serialize_timestamp(self, timestamp: datetime) -> str:
+        """Serialize timestamp as ISO 8601"""
+        return timestamp.isoformat()
 
 
 # RabbitMQ queue names
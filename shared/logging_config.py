@@ -1,11 +1,45 @@
 """Structured logging configuration for microservices."""
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
+import orjson
 import structlog
-from structlog.stdlib import LoggerFactory
+
+
+def _orjson_serializer(value, **kwargs) -> bytes:
+    """Serialize a log event dict with orjson.
+
+    orjson handles datetimes natively; Decimals (and anything else exotic)
+    fall back to str. Returns bytes, which BytesLoggerFactory writes to
+    stdout without a decode/encode round trip.
+    """
+    return orjson.dumps(value, default=str)
+
+
+# Started once by configure_logging; repeated calls reuse the same listener
+_log_listener = None
+
+
+def _only_on_exc(processor):
+    """Run processor only when the event carries stack or exception info.
+
+    StackInfoRenderer/format_exc_info walk the traceback machinery even for
+    plain records; the vast majority of events are INFO without exc_info, so
+    this guard keeps them off the common path.
+    """
+
+    def _processor(logger, method_name, event_dict):
+        if event_dict.get("stack_info") or event_dict.get("exc_info"):
+            return processor(logger, method_name, event_dict)
+        return event_dict
+
+    return _processor
 
 
 def configure_logging(service_name: str, log_level: str = None) -> None:
@@ -17,34 +51,45 @@ def configure_logging(service_name: str, log_level: str = None) -> None:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
                    If None, reads from LOG_LEVEL environment variable or defaults to INFO.
     """
+    global _log_listener
+
     # Get log level from parameter, environment variable, or default to INFO
     if log_level is None:
         log_level = os.getenv("LOG_LEVEL", "INFO")
 
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
-    )
-
-    # Configure structlog
+    # Configure standard library logging behind an in-process queue: request
+    # handlers only enqueue records, and a listener thread does the stream
+    # write, keeping stdout I/O off the hot path
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, log_level.upper()))
+    if _log_listener is None:
+        log_queue = queue.Queue(-1)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        root.handlers = [logging.handlers.QueueHandler(log_queue)]
+        _log_listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+
+    # Configure structlog. make_filtering_bound_logger turns below-threshold
+    # calls into a cheap no-op before any event dict is built, and
+    # BytesLoggerFactory writes the rendered JSON straight to stdout as
+    # bytes, so app events skip the stdlib handler machinery entirely
+    # (the queue above still serves third-party stdlib loggers like uvicorn).
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,  # Merge context variables
-            structlog.stdlib.filter_by_level,  # Filter by log level
-            structlog.stdlib.add_logger_name,  # Add logger name
-            structlog.stdlib.add_log_level,  # Add log level
-            structlog.stdlib.PositionalArgumentsFormatter(),  # Format positional args
+            mask_sensitive_processor,  # Mask sensitive keys in one pass
+            structlog.processors.add_log_level,  # Add log level
             structlog.processors.TimeStamper(fmt="iso"),  # ISO 8601 timestamps
-            structlog.processors.StackInfoRenderer(),  # Stack info for exceptions
-            structlog.processors.format_exc_info,  # Format exceptions
+            _only_on_exc(structlog.processors.StackInfoRenderer()),  # Stack info for exceptions
+            _only_on_exc(structlog.processors.format_exc_info),  # Format exceptions
             structlog.processors.UnicodeDecoder(),  # Decode unicode
-            structlog.processors.JSONRenderer(),  # JSON output
+            structlog.processors.JSONRenderer(serializer=_orjson_serializer),  # JSON output
         ],
         context_class=dict,
-        logger_factory=LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.BytesLoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, log_level.upper())),
         cache_logger_on_first_use=True,
     )
 
@@ -53,52 +98,72 @@ def configure_logging(service_name: str, log_level: str = None) -> None:
     structlog.contextvars.bind_contextvars(service=service_name)
 
 
-def get_logger(name: str = None) -> structlog.stdlib.BoundLogger:
-    """Get a structured logger instance."""
-    return structlog.get_logger(name)
+@functools.lru_cache(maxsize=None)
+def get_logger(name: str = None) -> structlog.typing.FilteringBoundLogger:
+    """Get a structured logger instance (memoized per name).
 
-
-# Masking functions for sensitive data
-def mask_account_number(account_number: str) -> str:
+    Returns a FilteringBoundLogger: below-threshold calls are a no-op
+    before any event dict is built. BytesLoggerFactory ignores positional
+    names, so the name is carried as a bound ``logger`` key instead.
+    Caching means repeated lookups of a name share one proxy, which pairs
+    with cache_logger_on_first_use to resolve each wrapped logger exactly
+    once.
     """
-    Mask account number showing first 3 and last 3 characters.
+    log = structlog.get_logger()
+    return log if name is None else log.bind(logger=name)
 
-    Args:
-        account_number: The account number to mask
 
-    Returns:
-        Masked account number (e.g., "ACC123456" -> "ACC****456")
-    """
-    if not account_number or len(account_number) < 6:
-        return "****"
-    return f"{account_number[:3]}****{account_number[-3:]}"
+# Masking for sensitive data. One shared slice-and-concat helper: these run
+# per log record on hot paths, so no regex and no per-variant f-string work.
+def _mask(value: str, head: int, tail: int, short: str) -> str:
+    """Mask value keeping head leading and tail trailing characters."""
+    if (len(value) if value else 0) < head + tail:
+        return short
+    return value[:head] + "****" + value[-tail:]
 
 
-def mask_balance(balance: str) -> str:
+def mask_sensitive_processor(logger, method_name, event_dict):
+    """Mask known-sensitive keys in a single pass at emit time.
+
+    Call sites can log raw values (including Decimals) under these keys;
+    masking happens once per record here instead of per callsite, and only
+    for events that survived level filtering. Goes through the public mask
+    functions so account numbers hit the memoized path.
     """
-    Mask balance showing first digit and last 2 characters.
+    for key in _SENSITIVE_KEYS.keys() & event_dict.keys():
+        value = event_dict[key]
+        event_dict[key] = _SENSITIVE_KEYS[key](value if isinstance(value, str) else str(value))
+    return event_dict
 
-    Args:
-        balance: The balance to mask (as string)
 
-    Returns:
-        Masked balance (e.g., "1000.50" -> "1***50")
+@functools.lru_cache(maxsize=4096)
+def mask_account_number(account_number: str) -> str:
+    """Mask account number showing first 3 and last 3 characters
+    (e.g., "ACC123456" -> "ACC****456").
+
+    Memoized: account numbers recur heavily (hot accounts), the function is
+    pure, and the key space is bounded, so repeat masks are a dict hit.
+    Amount/balance masks stay uncached — their values are near-unique and
+    would only churn a cache.
     """
-    if not balance or len(balance) < 3:
-        return "***"
-    return f"{balance[0]}****{balance[-2:]}"
+    return _mask(account_number, 3, 3, "****")
+
+
+def mask_balance(balance: str) -> str:
+    """Mask balance showing first digit and last 2 characters
+    (e.g., "1000.50" -> "1****50")."""
+    return _mask(balance, 1, 2, "***")
 
 
 def mask_amount(amount: str) -> str:
-    """
-    Mask transaction amount showing first digit and last 2 characters.
+    """Mask transaction amount showing first digit and last 2 characters
+    (e.g., "500.00" -> "5****00")."""
+    return _mask(amount, 1, 2, "***")
 
-    Args:
-        amount: The amount to mask (as string)
 
-    Returns:
-        Masked amount (e.g., "500.00" -> "5***00")
-    """
-    if not amount or len(amount) < 3:
-        return "***"
-    return f"{amount[0]}****{amount[-2:]}"
+# Sensitive event keys and the mask applied by mask_sensitive_processor
+_SENSITIVE_KEYS = {
+    "account_number": mask_account_number,
+    "amount": mask_amount,
+    "balance": mask_balance,
+}
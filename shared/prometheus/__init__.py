@@ -9,6 +9,7 @@ except ImportError:
 from .error_metrics import register_error_metrics  # noqa: F401
 from .rabbit_metrics import (  # noqa: F401
     record_consume,
+    record_consume_batch,
     record_publish,
     register_rabbitmq_metrics,
 )
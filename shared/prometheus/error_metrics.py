@@ -4,9 +4,13 @@ from prometheus_client import Counter
 ERRORS_TOTAL = Counter(
     "app_errors_total",
     "Application errors",
-    ["endpoint", "status_class", "status_code"],
+    ["endpoint", "status_class"],
 )
 
+# Child counters cached per (endpoint, status_class); endpoints are route
+# templates so the key space is bounded by the app's route table
+_error_children = {}
+
 
 def register_error_metrics(app: FastAPI) -> None:
     @app.middleware("http")
@@ -14,12 +18,16 @@ def register_error_metrics(app: FastAPI) -> None:
         response = await call_next(request)
 
         if response.status_code >= 400:
+            # Only the route template is a safe label: raw URL paths (404s,
+            # unmatched parameterized paths) would mint a new time series per
+            # unique URL
             route = request.scope.get("route")
-            endpoint = getattr(route, "path", None) or request.url.path
-            ERRORS_TOTAL.labels(
-                endpoint=endpoint,
-                status_class=f"{response.status_code // 100}xx",
-                status_code=str(response.status_code),
-            ).inc()
+            endpoint = getattr(route, "path", None) or "__unmatched__"
+            key = (endpoint, f"{response.status_code // 100}xx")
+            child = _error_children.get(key)
+            if child is None:
+                child = ERRORS_TOTAL.labels(endpoint=key[0], status_class=key[1])
+                _error_children[key] = child
+            child.inc()
 
         return response
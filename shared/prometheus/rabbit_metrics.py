@@ -16,14 +16,24 @@ MESSAGES_CONSUMED_TOTAL = Counter(
     ["queue", "status"],
 )
 
+# No status label here: it would double the histogram's series count, and the
+# consumed-total counter already splits success/failure. Buckets centre on the
+# tens-of-ms range where parse+DB processing actually lands.
 MESSAGE_PROCESSING_DURATION = Histogram(
     "rabbitmq_message_processing_duration_seconds",
     "Time taken to process a consumed message (seconds)",
-    ["queue", "status"],
-    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10),
+    ["queue"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
 )
 
 
+# Child metrics cached per label tuple; record_publish/record_consume run once
+# per message, so a plain dict lookup replaces .labels()'s hashing+validation
+_publish_children: dict[tuple[str, str], Counter] = {}
+_consume_children: dict[tuple[str, str], Counter] = {}
+_duration_children: dict[str, Histogram] = {}
+
+
 def register_rabbitmq_metrics(
     exchanges: Iterable[str] | None = None,
     routing_keys: Iterable[str] | None = None,
@@ -35,23 +45,55 @@ def register_rabbitmq_metrics(
         routing_key_values: Tuple[str, ...] = tuple(routing_keys or ("",))
         for exchange in exchange_values:
             for routing_key in routing_key_values:
-                MESSAGES_PUBLISHED_TOTAL.labels(exchange=exchange or "", routing_key=routing_key or "")
+                key = (exchange or "", routing_key or "")
+                _publish_children[key] = MESSAGES_PUBLISHED_TOTAL.labels(*key)
 
     if queues is not None or statuses is not None:
         queue_values: Tuple[str, ...] = tuple(queues or ("",))
         status_values: Tuple[str, ...] = tuple(statuses or ("success", "failed"))
         for queue in queue_values:
+            _duration_children[queue or ""] = MESSAGE_PROCESSING_DURATION.labels(queue or "")
             for status in status_values:
-                MESSAGES_CONSUMED_TOTAL.labels(queue=queue or "", status=status or "")
-                MESSAGE_PROCESSING_DURATION.labels(queue=queue or "", status=status or "")
+                key = (queue or "", status or "")
+                _consume_children[key] = MESSAGES_CONSUMED_TOTAL.labels(*key)
 
 
 def record_publish(exchange: str, routing_key: str) -> None:
-    MESSAGES_PUBLISHED_TOTAL.labels(exchange=exchange or "", routing_key=routing_key or "").inc()
+    key = (exchange or "", routing_key or "")
+    child = _publish_children.get(key)
+    if child is None:
+        child = _publish_children[key] = MESSAGES_PUBLISHED_TOTAL.labels(*key)
+    child.inc()
 
 
 def record_consume(queue: str, status: str, duration: float) -> None:
-    normalized_queue = queue or ""
-    normalized_status = status or ""
-    MESSAGES_CONSUMED_TOTAL.labels(queue=normalized_queue, status=normalized_status).inc()
-    MESSAGE_PROCESSING_DURATION.labels(queue=normalized_queue, status=normalized_status).observe(max(duration, 0))
+    key = (queue or "", status or "")
+    counter = _consume_children.get(key)
+    if counter is None:
+        counter = _consume_children[key] = MESSAGES_CONSUMED_TOTAL.labels(*key)
+    counter.inc()
+    histogram = _duration_children.get(key[0])
+    if histogram is None:
+        histogram = _duration_children[key[0]] = MESSAGE_PROCESSING_DURATION.labels(key[0])
+    histogram.observe(max(duration, 0))
+
+
+def record_consume_batch(queue: str, status: str, count: int, duration: float) -> None:
+    """Record a whole consumed batch with one counter add and one observation.
+
+    Counter.inc and Histogram.observe each take a lock inside
+    prometheus_client; batching consumers call this once per batch instead of
+    once per message, so N messages cost two lock acquisitions rather than
+    2N. The histogram gets a single per-message-average sample per batch.
+    """
+    if count <= 0:
+        return
+    key = (queue or "", status or "")
+    counter = _consume_children.get(key)
+    if counter is None:
+        counter = _consume_children[key] = MESSAGES_CONSUMED_TOTAL.labels(*key)
+    counter.inc(count)
+    histogram = _duration_children.get(key[0])
+    if histogram is None:
+        histogram = _duration_children[key[0]] = MESSAGE_PROCESSING_DURATION.labels(key[0])
+    histogram.observe(max(duration / count, 0))
@@ -1,129 +1,178 @@
-import json
 import os
 import time
 
 import pika
 import structlog
+from pydantic import ValidationError
 
 from shared.events import TransactionEvent
-from shared.logging_config import get_logger, mask_account_number, mask_amount
-from shared.prometheus import record_consume
+from shared.logging_config import get_logger
+from shared.prometheus import record_consume, record_consume_batch
 from app.database import SessionLocal
 from app.metrics import record_transaction_failure
-from app.service import process_transaction
+from app.service import process_transaction, process_transactions_bulk
 
 logger = get_logger(__name__)
 
+# Batch parameters: up to PREFETCH_COUNT messages share one DB commit, and a
+# partial batch is flushed after the queue has been idle for the timeout
+PREFETCH_COUNT = 50
+BATCH_INACTIVITY_TIMEOUT = 0.05
 
-def callback(ch, method, _properties, body):
-    """Callback function to process incoming messages"""
-    # Extract correlation ID from message headers if available
-    correlation_id = "unknown"
-    if _properties.headers and "correlation_id" in _properties.headers:
-        correlation_id = _properties.headers["correlation_id"]
+# Built once on first use and reused across reconnects, so restart paths
+# don't re-probe the environment or rebuild credentials
+_connection_config = None
 
-    # Bind correlation ID to context for all logs in this callback
-    structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
 
-    queue_name = method.routing_key or os.getenv("RABBITMQ_QUEUE", "")
-    processing_status = "success"
-    start_time = time.perf_counter()
-    try:
-        # Parse message
-        message_data = json.loads(body)
-        event = TransactionEvent(**message_data)
+def _get_connection_config():
+    """Return (ConnectionParameters, queue_name), built once from the env."""
+    global _connection_config
+    if _connection_config is None:
+        rabbitmq_host = os.getenv("RABBITMQ_HOST")
+        rabbitmq_port_str = os.getenv("RABBITMQ_PORT")
+        rabbitmq_user = os.getenv("RABBITMQ_USER")
+        rabbitmq_password = os.getenv("RABBITMQ_PASSWORD")
+        rabbitmq_queue = os.getenv("RABBITMQ_QUEUE")
 
-        logger.info(
-            "transaction_event_received",
-            transaction_type=event.transaction_type,
-            account_id=event.account_id,
-            account_number=mask_account_number(event.account_number),
-            amount=mask_amount(str(event.amount)),
-            correlation_id=correlation_id,
+        if not all([rabbitmq_host, rabbitmq_port_str, rabbitmq_user, rabbitmq_password, rabbitmq_queue]):
+            raise RuntimeError("RabbitMQ environment variables are not set")
+
+        parameters = pika.ConnectionParameters(
+            host=rabbitmq_host,
+            port=int(rabbitmq_port_str),
+            credentials=pika.PlainCredentials(rabbitmq_user, rabbitmq_password),
+            heartbeat=30,
+            blocked_connection_timeout=60,
         )
+        _connection_config = (parameters, rabbitmq_queue)
+    return _connection_config
 
-        # Process transaction
-        db = SessionLocal()
-        try:
-            transaction = process_transaction(
-                db=db,
-                account_id=event.account_id,
-                account_number=event.account_number,
-                amount=event.amount,
-                transaction_type=event.transaction_type,
-            )
-            logger.info(
-                "transaction_processing_successful",
-                transaction_id=transaction.id,
-                account_id=event.account_id,
-                correlation_id=correlation_id,
-            )
 
-            # Acknowledge message
-            ch.basic_ack(delivery_tag=method.delivery_tag)
+def _correlation_id(properties) -> str:
+    """Extract the correlation ID from message headers, if present."""
+    if properties.headers and "correlation_id" in properties.headers:
+        return properties.headers["correlation_id"]
+    return "unknown"
 
-        except (ValueError, RuntimeError) as e:
-            record_transaction_failure(transaction_type=event.transaction_type)
+
+def _parse_batch(channel, queue_name, batch):
+    """Validate each raw message; nack (without requeue) those that fail.
+
+    Returns a list of (method, correlation_id, event) for the valid ones.
+    """
+    parsed = []
+    for method, properties, body in batch:
+        correlation_id = _correlation_id(properties)
+        try:
+            # Parse and validate in one pydantic-core pass over the raw
+            # bytes; no intermediate dict is built
+            event = TransactionEvent.model_validate_json(body)
+        except (ValidationError, ValueError) as e:
             logger.error(
-                "transaction_processing_failed",
-                account_id=event.account_id,
-                account_number=mask_account_number(event.account_number),
-                amount=mask_amount(str(event.amount)),
-                transaction_type=event.transaction_type,
+                "message_parse_failed",
                 correlation_id=correlation_id,
                 error=str(e),
                 error_type=type(e).__name__,
                 exc_info=True,
             )
-            # In production, you might want to use a dead letter queue
-            # For now, we'll reject and requeue
-            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
-            processing_status = "failed"
-        finally:
-            db.close()
+            channel.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            record_consume(queue=queue_name, status="failed", duration=0.0)
+            continue
+        parsed.append((method, correlation_id, event))
+    return parsed
 
-    except json.JSONDecodeError as e:
-        logger.error(
-            "message_parse_failed",
+
+def _process_message(channel, queue_name, method, correlation_id, event, db):
+    """Process a single event in its own DB transaction (fallback path)."""
+    structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
+    status = "success"
+    start_time = time.perf_counter()
+    try:
+        transaction = process_transaction(
+            db=db,
+            account_id=event.account_id,
+            account_number=event.account_number,
+            amount=event.amount,
+            transaction_type=event.transaction_type.value,
+        )
+        logger.info(
+            "transaction_processing_successful",
+            transaction_id=transaction.id,
+            account_id=event.account_id,
             correlation_id=correlation_id,
-            error=str(e),
-            error_type=type(e).__name__,
-            exc_info=True,
         )
-        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-        processing_status = "failed"
-    except (ConnectionError, RuntimeError) as e:
+        channel.basic_ack(delivery_tag=method.delivery_tag)
+    except (ValueError, RuntimeError) as e:
+        # The session is shared across messages, so leave it clean
+        db.rollback()
+        record_transaction_failure(transaction_type=event.transaction_type.value)
         logger.error(
-            "unexpected_callback_error",
+            "transaction_processing_failed",
+            account_id=event.account_id,
+            account_number=event.account_number,
+            amount=event.amount,
+            transaction_type=event.transaction_type.value,
             correlation_id=correlation_id,
             error=str(e),
             error_type=type(e).__name__,
             exc_info=True,
         )
-        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
-        processing_status = "failed"
+        # In production, you might want to use a dead letter queue
+        # For now, we'll reject and requeue
+        channel.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+        status = "failed"
     finally:
-        # Clear context vars after processing
         structlog.contextvars.clear_contextvars()
-        duration = time.perf_counter() - start_time
-        record_consume(queue=queue_name, status=processing_status, duration=duration)
+        record_consume(queue=queue_name, status=status, duration=time.perf_counter() - start_time)
 
 
-def start_consumer():
-    """Start consuming messages from RabbitMQ"""
+def _process_batch(channel, queue_name, batch, db):
+    """Process a drained batch of messages sharing one DB commit.
+
+    All valid events go into a single transaction and are acked together
+    with one multiple-ack on the highest delivery tag, amortizing commit
+    fsyncs and broker round trips. If anything in the shared transaction
+    fails, the batch is rolled back and retried message by message so one
+    bad event cannot poison its neighbours. The session itself is owned by
+    start_consumer and reused across batches, so the pool sees no
+    per-message checkout churn.
+    """
+    parsed = _parse_batch(channel, queue_name, batch)
+    if not parsed:
+        return
+
+    start_time = time.perf_counter()
     try:
-        rabbitmq_host = os.getenv("RABBITMQ_HOST")
-        rabbitmq_port_str = os.getenv("RABBITMQ_PORT")
-        rabbitmq_user = os.getenv("RABBITMQ_USER")
-        rabbitmq_password = os.getenv("RABBITMQ_PASSWORD")
-        rabbitmq_queue = os.getenv("RABBITMQ_QUEUE")
+        rows = [
+            {
+                "account_id": event.account_id,
+                "account_number": event.account_number,
+                "amount": event.amount,
+                "transaction_type": event.transaction_type.value,
+            }
+            for _method, _correlation_id, event in parsed
+        ]
+        process_transactions_bulk(db, rows)
+    except Exception:
+        db.rollback()
+        logger.warning("batch_processing_failed_retrying_individually", batch_size=len(parsed))
+        for method, correlation_id, event in parsed:
+            _process_message(channel, queue_name, method, correlation_id, event, db)
+        return
+
+    channel.basic_ack(delivery_tag=parsed[-1][0].delivery_tag, multiple=True)
+    record_consume_batch(
+        queue=queue_name,
+        status="success",
+        count=len(parsed),
+        duration=time.perf_counter() - start_time,
+    )
 
-        if not all([rabbitmq_host, rabbitmq_port_str, rabbitmq_user, rabbitmq_password, rabbitmq_queue]):
-            raise RuntimeError("RabbitMQ environment variables are not set")
 
-        rabbitmq_port = int(rabbitmq_port_str)
-        credentials = pika.PlainCredentials(rabbitmq_user, rabbitmq_password)
-        parameters = pika.ConnectionParameters(host=rabbitmq_host, port=rabbitmq_port, credentials=credentials)
+def start_consumer():
+    """Start consuming messages from RabbitMQ"""
+    try:
+        parameters, rabbitmq_queue = _get_connection_config()
 
         connection = pika.BlockingConnection(parameters)
         channel = connection.channel()
@@ -131,26 +180,42 @@ def start_consumer():
         # Declare queue (idempotent operation)
         channel.queue_declare(queue=rabbitmq_queue, durable=True)
 
-        # Set QoS to process one message at a time
-        channel.basic_qos(prefetch_count=1)
-
-        # Set up consumer
-        channel.basic_consume(queue=rabbitmq_queue, on_message_callback=callback)
+        # Prefetch a full batch so the drain loop below can group commits
+        channel.basic_qos(prefetch_count=PREFETCH_COUNT)
 
         logger.info(
             "rabbitmq_consumer_started",
             queue=rabbitmq_queue,
-            host=rabbitmq_host,
-            port=rabbitmq_port,
+            host=parameters.host,
+            port=parameters.port,
+            prefetch_count=PREFETCH_COUNT,
         )
         logger.info("waiting_for_messages")
 
-        # Start consuming
-        channel.start_consuming()
+        # One session for the consumer's lifetime: reused across batches so
+        # the pool sees no per-message checkout/construction churn
+        db = SessionLocal()
+
+        # Drain loop: accumulate until the batch is full or the queue goes
+        # idle, then process the whole batch in one DB transaction
+        try:
+            batch = []
+            for method, properties, body in channel.consume(rabbitmq_queue, inactivity_timeout=BATCH_INACTIVITY_TIMEOUT):
+                if method is None:
+                    if batch:
+                        _process_batch(channel, rabbitmq_queue, batch, db)
+                        batch = []
+                    continue
+                batch.append((method, properties, body))
+                if len(batch) >= PREFETCH_COUNT:
+                    _process_batch(channel, rabbitmq_queue, batch, db)
+                    batch = []
+        finally:
+            db.close()
 
     except KeyboardInterrupt:
         logger.info("rabbitmq_consumer_stopping")
-        channel.stop_consuming()
+        channel.cancel()
         connection.close()
     except (ConnectionError, RuntimeError) as e:
         logger.error(
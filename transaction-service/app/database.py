@@ -2,23 +2,45 @@ import os
 from shared.logging_config import get_logger
 from shared.prometheus.db_metrics import setup_db_metrics
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 logger = get_logger(__name__)
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-Base = declarative_base()
+# Connection pool tuning (overridable via environment for load experiments)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# pre_ping costs a liveness round trip on every checkout; with LIFO reuse and
+# a 30-minute recycle, stale connections are rare enough that the default is
+# off. Flip on where the network drops idle connections aggressively.
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "0") == "1"
+
+
+class Base(DeclarativeBase):
+    pass
+
 
 # Lazy initialization - only create engine if DATABASE_URL is set
 engine = None
 SessionLocal = None
 
 if DATABASE_URL:
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        pool_use_lifo=True,  # Reuse hot connections and let overflow drain
+    )
     setup_db_metrics(engine)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # expire_on_commit=False: committed objects keep their attributes, so the
+    # consumer's post-commit log lines don't trigger a refresh SELECT each
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 def get_db():
@@ -4,8 +4,11 @@ import time
 import threading
 import uuid
 
+import anyio.to_thread
 import structlog
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import inspect
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from shared.prometheus import register_rabbitmq_metrics
@@ -20,13 +23,21 @@ from app.metrics import register_transaction_metrics
 configure_logging(service_name="transaction-service")
 logger = get_logger(__name__)
 
-# Create database tables (only if engine is initialized)
-if engine is not None:
-    Base.metadata.create_all(bind=engine)
-    logger.info("database_tables_initialized")
+# Create database tables (only if engine is initialized and this worker is
+# designated to run schema bootstrap; replicas set RUN_MIGRATIONS=0 so that
+# N workers don't all issue the same DDL round-trips on cold start)
+if engine is not None and os.getenv("RUN_MIGRATIONS", "1") == "1":
+    if not inspect(engine).has_table("transactions"):
+        Base.metadata.create_all(bind=engine)
+        logger.info("database_tables_initialized")
+    else:
+        logger.info("database_tables_already_present")
 
 app = FastAPI(
-    title="Transaction Service", description="Microservice for processing and auditing transactions", version="1.0.0"
+    title="Transaction Service",
+    description="Microservice for processing and auditing transactions",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add Prometheus instrumentation
@@ -91,8 +102,11 @@ app.include_router(router)
 
 
 @app.on_event("startup")
-def startup_event():
+async def startup_event():
     """Start RabbitMQ consumer on application startup"""
+    # Raise the shared anyio threadpool ceiling (default ~40): sync DB work
+    # offloaded from async handlers and sync dependencies all draw from it
+    anyio.to_thread.current_default_thread_limiter().total_tokens = int(os.getenv("THREADPOOL_TOKENS", "100"))
     consumer_thread = threading.Thread(target=start_consumer, daemon=True)
     consumer_thread.start()
     logger.info("transaction_service_started", consumer_thread_initialized=True)
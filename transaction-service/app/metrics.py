@@ -16,7 +16,10 @@ TRANSACTION_AMOUNT = Histogram(
     "transaction_service_transaction_amount",
     "Observed transaction amounts grouped by type",
     ["type"],
-    buckets=[10, 50, 100, 500, 1000, 5000, 10000],
+    # Coarse buckets on purpose: each bucket is a full time series per type
+    # label and a counter write per observe; order-of-magnitude resolution is
+    # enough to tell small transfers from fraud-threshold-sized ones
+    buckets=[100, 1000, 10000],
 )
 
 FRAUD_TRANSACTIONS_TOTAL = Counter(
@@ -26,6 +29,20 @@ FRAUD_TRANSACTIONS_TOTAL = Counter(
 )
 
 
+# Closed label value sets: values outside these fold into "other" so
+# caller-supplied strings can never mint unbounded time series
+TRANSACTION_TYPES = frozenset({"deposit", "withdraw"})
+FRAUD_REASONS = frozenset({"large_transaction_detected"})
+
+# Label children cached per label values; record_* runs per transaction, so a
+# dict lookup replaces .labels()'s hashing and validation on the hot path.
+# Populated by register_transaction_metrics and lazily for unseen values.
+_success_children: dict[str, Counter] = {}
+_failure_children: dict[str, Counter] = {}
+_amount_children: dict[str, Histogram] = {}
+_fraud_children: dict[tuple[str, str], Counter] = {}
+
+
 def _to_float(amount: Union[Decimal, float, int]) -> float | None:
     if amount is None:
         return None
@@ -36,18 +53,39 @@ def _to_float(amount: Union[Decimal, float, int]) -> float | None:
 
 
 def record_transaction_success(transaction_type: str, amount: Union[Decimal, float, int]) -> None:
-    TRANSACTIONS_TOTAL.labels(type=transaction_type, status="success").inc()
+    if transaction_type not in TRANSACTION_TYPES:
+        transaction_type = "other"
+    counter = _success_children.get(transaction_type)
+    if counter is None:
+        counter = _success_children[transaction_type] = TRANSACTIONS_TOTAL.labels(type=transaction_type, status="success")
+    counter.inc()
     value = _to_float(amount)
     if value is not None:
-        TRANSACTION_AMOUNT.labels(type=transaction_type).observe(value)
+        histogram = _amount_children.get(transaction_type)
+        if histogram is None:
+            histogram = _amount_children[transaction_type] = TRANSACTION_AMOUNT.labels(type=transaction_type)
+        histogram.observe(value)
 
 
 def record_transaction_failure(transaction_type: str) -> None:
-    TRANSACTIONS_TOTAL.labels(type=transaction_type, status="failed").inc()
+    if transaction_type not in TRANSACTION_TYPES:
+        transaction_type = "other"
+    counter = _failure_children.get(transaction_type)
+    if counter is None:
+        counter = _failure_children[transaction_type] = TRANSACTIONS_TOTAL.labels(type=transaction_type, status="failed")
+    counter.inc()
 
 
 def record_fraudulent_transaction(transaction_type: str, reason: str) -> None:
-    FRAUD_TRANSACTIONS_TOTAL.labels(type=transaction_type, reason=reason).inc()
+    if transaction_type not in TRANSACTION_TYPES:
+        transaction_type = "other"
+    if reason not in FRAUD_REASONS:
+        reason = "other"
+    key = (transaction_type, reason)
+    counter = _fraud_children.get(key)
+    if counter is None:
+        counter = _fraud_children[key] = FRAUD_TRANSACTIONS_TOTAL.labels(type=transaction_type, reason=reason)
+    counter.inc()
 
 
 def register_transaction_metrics(
@@ -61,14 +99,13 @@ def register_transaction_metrics(
     app.state.transaction_metrics_registered = True
 
     types = tuple(transaction_types or ("deposit", "withdraw"))
-    statuses = ("success", "failed")
     reasons = tuple(fraud_reasons or ("large_transaction_detected",))
 
     for transaction_type in types:
-        for status in statuses:
-            TRANSACTIONS_TOTAL.labels(type=transaction_type, status=status)
-        TRANSACTION_AMOUNT.labels(type=transaction_type)
+        _success_children[transaction_type] = TRANSACTIONS_TOTAL.labels(type=transaction_type, status="success")
+        _failure_children[transaction_type] = TRANSACTIONS_TOTAL.labels(type=transaction_type, status="failed")
+        _amount_children[transaction_type] = TRANSACTION_AMOUNT.labels(type=transaction_type)
 
     for transaction_type in types:
         for reason in reasons:
-            FRAUD_TRANSACTIONS_TOTAL.labels(type=transaction_type, reason=reason)
+            _fraud_children[(transaction_type, reason)] = FRAUD_TRANSACTIONS_TOTAL.labels(type=transaction_type, reason=reason)
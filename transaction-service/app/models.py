@@ -1,4 +1,9 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, Boolean
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Index, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -6,12 +11,32 @@ from app.database import Base
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    # Fetch server-generated columns (id, processed_at) via RETURNING in the
+    # INSERT itself, so no post-commit refresh SELECT is needed
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # No standalone index: the composite index below covers account_id lookups
+    account_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    account_number: Mapped[str] = mapped_column(String(32), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    transaction_type: Mapped[str] = mapped_column(String, nullable=False)  # "deposit" or "withdraw"
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()  # pylint: disable=not-callable
+    )
+    fraud_detected: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Deferred: only fraud-flagged rows carry notes, so plain ORM loads skip
+    # the column and fetch it on first access. The list endpoint still selects
+    # it explicitly — notes is part of TransactionResponse.
+    notes: Mapped[Optional[str]] = mapped_column(String, nullable=True, deferred=True)
+
 
-    id = Column(Integer, primary_key=True, index=True)
-    account_id = Column(Integer, nullable=False, index=True)
-    account_number = Column(String, nullable=False)
-    amount = Column(Numeric(10, 2), nullable=False)
-    transaction_type = Column(String, nullable=False)  # "deposit" or "withdraw"
-    processed_at = Column(DateTime(timezone=True), server_default=func.now())  # pylint: disable=not-callable
-    fraud_detected = Column(Boolean, default=False)
-    notes = Column(String, nullable=True)
+# Matches get_transactions exactly (filter by account_id, order by
+# processed_at DESC, id DESC), so the "latest N for account" pattern becomes
+# an index range scan + LIMIT instead of a sort over all matching rows
+Index(
+    "ix_transactions_account_processed",
+    Transaction.account_id,
+    Transaction.processed_at.desc(),
+    Transaction.id.desc(),
+)
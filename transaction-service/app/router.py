@@ -1,6 +1,12 @@
+import os
+import time
+from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -9,14 +15,70 @@ from app.service import get_transactions
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+# One adapter for the whole list: validates and dumps all rows in a single
+# pydantic-core traversal instead of FastAPI's per-row validate+dump
+_transaction_list_adapter = TypeAdapter(List[TransactionResponse])
 
-@router.get("", response_model=List[TransactionResponse])
-def list_transactions(
-    account_id: Optional[int] = Query(None, description="Filter by account ID"),
-    skip: int = Query(0, ge=0),
+# Micro-cache for repeated identical list requests (dashboard polls hit the
+# same param tuple many times per second). Off by default; enable by setting
+# a TTL in seconds. The TTL is meant to stay sub-second, so writes never need
+# to invalidate explicitly — stale pages age out before anyone notices.
+_LIST_CACHE_TTL = float(os.getenv("TRANSACTION_LIST_CACHE_TTL", "0"))
+_LIST_CACHE_MAXSIZE = 512
+_list_cache: dict = {}
+
+
+def _cached_response(key):
+    entry = _list_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _LIST_CACHE_TTL:
+        return Response(content=entry[1], media_type="application/json", headers=entry[2])
+    return None
+
+
+@router.get("", response_model=None, responses={200: {"model": List[TransactionResponse]}})
+async def list_transactions(
+    account_id: Optional[int] = Query(None, ge=0, description="Filter by account ID"),
+    skip: int = Query(0, ge=0, deprecated=True, description="Offset fallback; prefer the after_* cursor"),
     limit: int = Query(100, ge=1, le=1000),
+    after_processed_at: Optional[datetime] = Query(
+        None, description="Keyset cursor: processed_at of the last item of the previous page"
+    ),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: id of the last item of the previous page"),
     db: Session = Depends(get_db),
 ):
     """Get transaction history"""
-    transactions = get_transactions(db, account_id=account_id, skip=skip, limit=limit)
-    return transactions
+    cache_key = None
+    if _LIST_CACHE_TTL > 0:
+        cache_key = (account_id, skip, limit, after_processed_at, after_id)
+        cached = _cached_response(cache_key)
+        if cached is not None:
+            return cached
+    # async handler + threadpool for only the blocking DB call: cache hits,
+    # validation and serialization stay on the event loop instead of tying up
+    # a worker thread for the whole request
+    transactions = await run_in_threadpool(
+        get_transactions,
+        db,
+        account_id=account_id,
+        skip=skip,
+        limit=limit,
+        after_processed_at=after_processed_at,
+        after_id=after_id,
+    )
+    # Cursor for the next page; clients pass these back instead of a growing
+    # offset, so deep pages stay O(limit) server-side
+    headers = {}
+    if transactions:
+        last = transactions[-1]
+        headers["X-Next-After-Processed-At"] = last.processed_at.isoformat()
+        headers["X-Next-After-Id"] = str(last.id)
+    payload = _transaction_list_adapter.dump_python(
+        _transaction_list_adapter.validate_python(transactions, from_attributes=True),
+        mode="json",
+    )
+    body = orjson.dumps(payload)
+    if cache_key is not None:
+        if len(_list_cache) >= _LIST_CACHE_MAXSIZE:
+            _list_cache.clear()
+        _list_cache[cache_key] = (time.monotonic(), body, headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,8 +1,10 @@
+import functools
 from decimal import Decimal
 
+from sqlalchemy import bindparam, insert, select, tuple_
 from sqlalchemy.orm import Session
 
-from shared.logging_config import get_logger, mask_account_number, mask_amount
+from shared.logging_config import get_logger, mask_amount
 from app.metrics import (
     record_transaction_success,
     record_fraudulent_transaction,
@@ -13,31 +15,91 @@ logger = get_logger(__name__)
 
 # Fraud detection threshold (simple example)
 FRAUD_THRESHOLD = Decimal("10000.00")
-
-
-def process_transaction(db: Session, account_id: int, account_number: str, amount: Decimal, transaction_type: str):
-    """Process a transaction and store it in the database"""
-
-    # Simple fraud detection simulation
-    fraud_detected = False
-    notes = None
-
-    if amount > FRAUD_THRESHOLD:
-        fraud_detected = True
-        notes = f"Large transaction detected: {amount} {transaction_type}"
+# Integer-cents mirror for the per-transaction comparison: int compares are a
+# plain C-level op, while Decimal comparisons pay context and normalization
+# costs on every call
+FRAUD_THRESHOLD_CENTS = 1_000_000
+# Masked once at import: the threshold never changes, so the alert path
+# shouldn't re-mask it per event
+_MASKED_THRESHOLD = mask_amount(str(FRAUD_THRESHOLD))
+
+
+def _check_fraud(account_id: int, account_number: str, amount: Decimal, transaction_type: str):
+    """Run the fraud heuristic for one transaction.
+
+    Returns (fraud_detected, notes) and handles the alert log and metric.
+    """
+    if int(amount * 100) > FRAUD_THRESHOLD_CENTS:
+        # One Decimal-to-str conversion, reused for notes and the log entry
+        # (the masking processor keeps str values as-is)
+        amount_str = str(amount)
+        notes = f"Large transaction detected: {amount_str} {transaction_type}"
         logger.warning(
             "fraud_alert",
             reason="large_transaction_detected",
             account_id=account_id,
-            account_number=mask_account_number(account_number),
-            amount=mask_amount(str(amount)),
+            account_number=account_number,
+            amount=amount_str,
             transaction_type=transaction_type,
-            threshold=mask_amount(str(FRAUD_THRESHOLD)),
+            threshold=_MASKED_THRESHOLD,
         )
         record_fraudulent_transaction(
             transaction_type=transaction_type,
             reason="large_transaction_detected",
         )
+        return True, notes
+    return False, None
+
+
+def process_transactions_bulk(db: Session, rows: list, commit: bool = True):
+    """Insert many transactions in one executemany round trip.
+
+    rows is a list of dicts with account_id, account_number, amount and
+    transaction_type; fraud fields are filled in here. Returns the assigned
+    primary keys in input order via RETURNING, so no per-row refresh is
+    needed.
+    """
+    mappings = []
+    for row in rows:
+        fraud_detected, notes = _check_fraud(row["account_id"], row["account_number"], row["amount"], row["transaction_type"])
+        mappings.append({**row, "fraud_detected": fraud_detected, "notes": notes})
+
+    ids = db.execute(insert(Transaction).returning(Transaction.id), mappings).scalars().all()
+    if commit:
+        db.commit()
+
+    for mapping, transaction_id in zip(mappings, ids):
+        logger.info(
+            "transaction_processed",
+            transaction_id=transaction_id,
+            account_id=mapping["account_id"],
+            account_number=mapping["account_number"],
+            amount=mapping["amount"],
+            transaction_type=mapping["transaction_type"],
+            fraud_detected=mapping["fraud_detected"],
+        )
+        record_transaction_success(transaction_type=mapping["transaction_type"], amount=mapping["amount"])
+
+    return ids
+
+
+def process_transaction(
+    db: Session,
+    account_id: int,
+    account_number: str,
+    amount: Decimal,
+    transaction_type: str,
+    commit: bool = True,
+):
+    """Process a transaction and store it in the database.
+
+    With commit=False the caller owns the transaction boundary (used by the
+    consumer to batch several events into one commit); the record is only
+    flushed so its primary key is assigned.
+    """
+
+    # Simple fraud detection simulation
+    fraud_detected, notes = _check_fraud(account_id, account_number, amount, transaction_type)
 
     # Create transaction record
     transaction = Transaction(
@@ -50,15 +112,17 @@ def process_transaction(db: Session, account_id: int, account_number: str, amoun
     )
 
     db.add(transaction)
-    db.commit()
-    db.refresh(transaction)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
 
     logger.info(
         "transaction_processed",
         transaction_id=transaction.id,
         account_id=account_id,
-        account_number=mask_account_number(account_number),
-        amount=mask_amount(str(amount)),
+        account_number=account_number,
+        amount=amount,
         transaction_type=transaction_type,
         fraud_detected=fraud_detected,
     )
@@ -68,11 +132,72 @@ def process_transaction(db: Session, account_id: int, account_number: str, amoun
     return transaction
 
 
-def get_transactions(db: Session, account_id: int = None, skip: int = 0, limit: int = 100):
-    """Get transaction history"""
-    query = db.query(Transaction)
+@functools.lru_cache(maxsize=None)
+def _list_stmt(filter_account: bool, use_cursor: bool, use_skip: bool):
+    """Build the list statement for one query shape, memoized per shape.
+
+    Values are carried as bindparams, so each of the (at most eight) shapes
+    is constructed exactly once per process and every call thereafter skips
+    the Python-side expression-tree assembly entirely.
+    """
+    # Core select of plain columns: rows come back as named tuples without
+    # ORM instance hydration or identity-map bookkeeping, which the
+    # read-only list path never needs
+    stmt = select(
+        Transaction.id,
+        Transaction.account_id,
+        Transaction.account_number,
+        Transaction.amount,
+        Transaction.transaction_type,
+        Transaction.processed_at,
+        Transaction.fraud_detected,
+        Transaction.notes,
+    )
+
+    if filter_account:
+        stmt = stmt.where(Transaction.account_id == bindparam("acct"))
 
-    if account_id:
-        query = query.filter(Transaction.account_id == account_id)
+    if use_cursor:
+        stmt = stmt.where(
+            tuple_(Transaction.processed_at, Transaction.id) < tuple_(bindparam("after_processed_at"), bindparam("after_id"))
+        )
 
-    return query.order_by(Transaction.processed_at.desc(), Transaction.id.desc()).offset(skip).limit(limit).all()
+    stmt = stmt.order_by(Transaction.processed_at.desc(), Transaction.id.desc())
+
+    if use_skip:
+        stmt = stmt.offset(bindparam("skip"))
+
+    return stmt.limit(bindparam("limit"))
+
+
+def get_transactions(
+    db: Session,
+    account_id: int = None,
+    skip: int = 0,
+    limit: int = 100,
+    after_processed_at=None,
+    after_id: int = None,
+):
+    """Get transaction history.
+
+    When an (after_processed_at, after_id) cursor is given, keyset
+    pagination seeks directly to the page via the composite index — O(limit)
+    regardless of depth. skip remains as a deprecated offset fallback and is
+    ignored when a cursor is present.
+    """
+    use_cursor = after_processed_at is not None and after_id is not None
+    use_skip = bool(skip) and after_id is None
+
+    params = {"limit": limit}
+    # "is not None", not truthiness: account_id=0 is a valid filter value and
+    # must not silently return every account's rows
+    if account_id is not None:
+        params["acct"] = account_id
+    if use_cursor:
+        params["after_processed_at"] = after_processed_at
+        params["after_id"] = after_id
+    if use_skip:
+        params["skip"] = skip
+
+    stmt = _list_stmt(account_id is not None, use_cursor, use_skip)
+    return db.execute(stmt, params).all()
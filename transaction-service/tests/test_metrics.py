@@ -0,0 +1,17 @@
+from app import metrics
+
+
+def test_unknown_transaction_type_folds_into_other():
+    """Unknown types must not mint new label values"""
+    metrics.record_transaction_failure("not-a-real-type")
+
+    assert "not-a-real-type" not in metrics._failure_children
+    assert "other" in metrics._failure_children
+
+
+def test_unknown_fraud_reason_folds_into_other():
+    """Unknown reasons must not mint new label values"""
+    metrics.record_fraudulent_transaction("deposit", "attacker-controlled-reason")
+
+    assert ("deposit", "attacker-controlled-reason") not in metrics._fraud_children
+    assert ("deposit", "other") in metrics._fraud_children
@@ -43,6 +43,24 @@ def test_get_transactions_pagination(client, test_db):
     assert len(data) == 2
 
 
+def test_get_transactions_micro_cache(client, test_db, monkeypatch):
+    """Test that the TTL micro-cache serves repeated identical requests"""
+    from app import router
+
+    monkeypatch.setattr(router, "_LIST_CACHE_TTL", 60.0)
+    monkeypatch.setattr(router, "_list_cache", {})
+
+    service.process_transaction(test_db, 1, "ACC001", Decimal("100.00"), "deposit")
+    first = client.get("/transactions?account_id=1")
+    assert first.status_code == status.HTTP_200_OK
+
+    # A write inside the TTL window is invisible to the cached page
+    service.process_transaction(test_db, 1, "ACC001", Decimal("200.00"), "deposit")
+    second = client.get("/transactions?account_id=1")
+    assert second.content == first.content
+    assert len(second.json()) == 1
+
+
 def test_get_transactions_empty(client):
     """Test GET /transactions when no transactions exist"""
     response = client.get("/transactions")
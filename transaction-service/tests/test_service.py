@@ -1,4 +1,5 @@
 import pytest
+from datetime import datetime
 from decimal import Decimal
 
 from app import service
@@ -64,6 +65,21 @@ def test_process_transaction_no_fraud_small_amount(test_db):
     assert transaction.fraud_detected is False
 
 
+def test_process_transactions_bulk(test_db):
+    """Test bulk insertion returns IDs in order and applies fraud detection"""
+    rows = [
+        {"account_id": 1, "account_number": "ACC001", "amount": Decimal("100.00"), "transaction_type": "deposit"},
+        {"account_id": 2, "account_number": "ACC002", "amount": Decimal("15000.00"), "transaction_type": "deposit"},
+    ]
+    ids = service.process_transactions_bulk(test_db, rows)
+
+    assert len(ids) == 2
+    transactions = {t.id: t for t in test_db.query(Transaction).all()}
+    assert transactions[ids[0]].fraud_detected is False
+    assert transactions[ids[1]].fraud_detected is True
+    assert "Large transaction" in transactions[ids[1]].notes
+
+
 def test_get_transactions_all(test_db):
     """Test getting all transactions"""
     # Create multiple transactions
@@ -98,6 +114,39 @@ def test_get_transactions_pagination(test_db):
     assert len(transactions) == 2
 
 
+def test_get_transactions_account_id_zero(test_db):
+    """Test that account_id=0 filters instead of returning all rows"""
+    service.process_transaction(test_db, 0, "ACC000", Decimal("10.00"), "deposit")
+    service.process_transaction(test_db, 1, "ACC001", Decimal("20.00"), "deposit")
+
+    transactions = service.get_transactions(test_db, account_id=0)
+    assert len(transactions) == 1
+    assert transactions[0].account_id == 0
+
+
+def test_get_transactions_keyset_pagination(test_db):
+    """Test keyset pagination via the (processed_at, id) cursor"""
+    for i in range(5):
+        service.process_transaction(
+            test_db, 1, "ACC001", Decimal(f"{i + 1}00.00"), "deposit"
+        )
+    # Distinct timestamps per row: SQLite's CURRENT_TIMESTAMP has second
+    # granularity, and the cursor comparison needs a real ordering to seek on
+    for n, transaction in enumerate(test_db.query(Transaction).order_by(Transaction.id).all()):
+        transaction.processed_at = datetime(2024, 1, 1, 12, 0, n)
+    test_db.commit()
+
+    first_page = service.get_transactions(test_db, limit=2)
+    assert len(first_page) == 2
+
+    cursor = first_page[-1]
+    second_page = service.get_transactions(
+        test_db, limit=2, after_processed_at=cursor.processed_at, after_id=cursor.id
+    )
+    assert len(second_page) == 2
+    assert all(t.id < cursor.id for t in second_page)
+
+
 def test_get_transactions_empty(test_db):
     """Test getting transactions when none exist"""
     transactions = service.get_transactions(test_db)